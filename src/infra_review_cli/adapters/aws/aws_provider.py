@@ -3,20 +3,25 @@
 AWS implementation of the CloudProvider interface.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from typing import Optional
-import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
+from infra_review_cli.adapters.aws.session import aws_client
+from infra_review_cli.config import SCAN_MAX_WORKERS
 from infra_review_cli.core.base_provider import BaseCloudProvider
 from infra_review_cli.core.models import ScanResult, Pillar
 from infra_review_cli.core.scoring import build_scan_result
-from infra_review_cli.core.ai.remediation import generate_executive_summary
 
 # Adapter imports
 from infra_review_cli.adapters.aws.ec2_adapter import fetch_cpu_data, fetch_unassociated_eips, fetch_asg_findings
 from infra_review_cli.adapters.aws.ebs_adapter import fetch_ebs_findings
-from infra_review_cli.adapters.aws.s3_adapter import fetch_s3_public_info, fetch_s3_versioning_findings
+from infra_review_cli.adapters.aws.s3_adapter import (
+    clear_bucket_cache,
+    fetch_s3_public_info,
+    fetch_s3_versioning_findings,
+)
 from infra_review_cli.adapters.aws.elb_adapter import fetch_elb_findings, fetch_alb_dns_names
 from infra_review_cli.adapters.aws.ecs_adapter import fetch_ecs_findings
 from infra_review_cli.adapters.aws.vpc_adapter import fetch_vpc_findings
@@ -49,7 +54,7 @@ class AWSProvider(BaseCloudProvider):
     def validate_credentials(self) -> bool:
         """Checks if the user has valid AWS credentials."""
         try:
-            sts = boto3.client("sts", region_name=self.region)
+            sts = aws_client("sts", region_name=self.region)
             identity = sts.get_caller_identity()
             self._account_id = identity["Account"]
             return True
@@ -113,17 +118,44 @@ class AWSProvider(BaseCloudProvider):
         total_steps = len(steps) + 2  # +2 for S3 Public and CloudFront (special handling)
 
         # -------------------------------------------------------------------
-        # Standard Scan Steps
+        # Standard Scan Steps — independent, so they run concurrently.
+        # Results are collected per step index so finding order stays stable.
         # -------------------------------------------------------------------
-        for i, (label, func, pillar) in enumerate(steps):
-            if progress_callback:
-                progress_callback(label, i + 1, total_steps)
-            
-            # Simple filtering logic based on strings
-            if pillars and pillar.value not in pillars:
+        # Adapters create their boto3 clients through session.aws_client, which
+        # serialises client creation; the clients themselves are thread-safe.
+        # S3 fetchers share one bucket listing per scan
+        clear_bucket_cache()
+
+        results: list = [None] * len(steps)
+        done = 0
+        with ThreadPoolExecutor(max_workers=SCAN_MAX_WORKERS, thread_name_prefix="scan") as pool:
+            futures = {}
+            for i, (label, func, pillar) in enumerate(steps):
+                # Simple filtering logic based on strings
+                if pillars and pillar.value not in pillars:
+                    done += 1
+                    if progress_callback:
+                        progress_callback(label, done, total_steps)
+                    continue
+                futures[pool.submit(func, self.region)] = i
+
+            # The S3/ALB lookups feeding CloudFront are independent of the steps above
+            s3_future = pool.submit(fetch_s3_public_info, self.region)
+            alb_future = pool.submit(fetch_alb_dns_names, self.region)
+
+            for future in as_completed(futures):
+                i = futures[future]
+                results[i] = future.result()
+                done += 1
+                if progress_callback:
+                    progress_callback(steps[i][0], done, total_steps)
+
+            s3_findings, public_bucket_names = s3_future.result()
+            alb_dns_names = alb_future.result()
+
+        for (label, func, pillar), res in zip(steps, results):
+            if res is None:
                 continue
-                
-            res = func(self.region)
             scan_ok = True
             findings_out = res
 
@@ -143,23 +175,18 @@ class AWSProvider(BaseCloudProvider):
         # -------------------------------------------------------------------
         # Specialized Steps (sharing data)
         # -------------------------------------------------------------------
-        current_step = len(steps)
-        
         # S3 Public Info (returns findings + names for next step)
         if progress_callback:
-            progress_callback("S3 Public Access", current_step + 1, total_steps)
-        
-        s3_findings, public_bucket_names = fetch_s3_public_info(self.region)
+            progress_callback("S3 Public Access", total_steps - 1, total_steps)
+
         if not pillars or Pillar.SECURITY.value in pillars:
             findings.extend(s3_findings)
             checks_run_per_pillar[Pillar.SECURITY] += 1
-        
+
         # CloudFront (uses public bucket names and alb dns)
-        current_step += 1
         if progress_callback:
-            progress_callback("CloudFront Coverage", current_step + 1, total_steps)
-            
-        alb_dns_names = fetch_alb_dns_names(self.region)
+            progress_callback("CloudFront Coverage", total_steps, total_steps)
+
         cf_findings = fetch_cloudfront_findings(self.region, public_bucket_names, alb_dns_names)
         if not pillars or Pillar.PERFORMANCE.value in pillars:
             findings.extend(cf_findings)
@@ -177,15 +204,8 @@ class AWSProvider(BaseCloudProvider):
             scan_timestamp=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"),
         )
         
-        # Generate AI Executive Summary if enough findings
-        if findings:
-            result.executive_summary = generate_executive_summary(
-                findings=findings,
-                pillar_scores=result.pillar_scores,
-                overall_score=result.overall_score,
-                account_id=result.account_id,
-                region=result.region
-            )
+        # One AI round-trip for the executive summary and missing remediation
+        result = self.finalize_scan(result)
 
         result.scan_duration_seconds = round(
             (datetime.now(timezone.utc) - scan_start).total_seconds(), 2
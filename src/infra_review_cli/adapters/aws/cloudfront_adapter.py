@@ -3,12 +3,26 @@
 AWS CloudFront adapter — checks whether CDN is in use for public assets.
 """
 
-import boto3
+from collections.abc import Iterator
+
 from botocore.exceptions import ClientError
 
+from infra_review_cli.adapters.aws.session import aws_client
 from infra_review_cli.core.checks.performance import check_cloudfront_usage
 
 
+def _iter_distributions(cf) -> Iterator[dict]:
+    """Yields distribution origin data page by page."""
+    paginator = cf.get_paginator("list_distributions")
+    for page in paginator.paginate():
+        dist_list = page.get("DistributionList", {})
+        for item in dist_list.get("Items", []):
+            yield {
+                "DomainName": item.get("DomainName", ""),
+                "Origins": item.get("Origins", {}),
+            }
+
+
 def fetch_cloudfront_findings(
     region: str,
     public_bucket_names: list[str],
@@ -18,18 +32,10 @@ def fetch_cloudfront_findings(
     Lists CloudFront distributions and checks coverage for public buckets and ALBs.
     CloudFront is a global service — the region param is used in Finding.region.
     """
-    cf = boto3.client("cloudfront")  # CloudFront is global, no region needed
-    distributions = []
+    cf = aws_client("cloudfront")  # CloudFront is global, no region needed
 
     try:
-        paginator = cf.get_paginator("list_distributions")
-        for page in paginator.paginate():
-            dist_list = page.get("DistributionList", {})
-            for item in dist_list.get("Items", []):
-                distributions.append({
-                    "DomainName": item.get("DomainName", ""),
-                    "Origins": item.get("Origins", {}),
-                })
+        return check_cloudfront_usage(_iter_distributions(cf), public_bucket_names, alb_dns_names, region)
     except ClientError as e:
         code = e.response["Error"]["Code"]
         if code == "AccessDenied":
@@ -37,5 +43,3 @@ def fetch_cloudfront_findings(
         else:
             print(f"⚠️  CloudFront: {e}")
         return []
-
-    return check_cloudfront_usage(distributions, public_bucket_names, alb_dns_names, region)
@@ -3,9 +3,9 @@
 AWS CloudTrail adapter — fetches data for Operational Excellence checks.
 """
 
-import boto3
 from botocore.exceptions import ClientError
 
+from infra_review_cli.adapters.aws.session import aws_client
 from infra_review_cli.core.checks.operational_excellence import check_cloudtrail_enabled
 
 
@@ -13,7 +13,7 @@ def fetch_cloudtrail_findings(region: str) -> list:
     """
     Describes all trails and their logging status, then runs check_cloudtrail_enabled().
     """
-    cloudtrail = boto3.client("cloudtrail", region_name=region)
+    cloudtrail = aws_client("cloudtrail", region_name=region)
     findings = []
 
     try:
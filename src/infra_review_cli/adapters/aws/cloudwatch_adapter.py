@@ -3,15 +3,15 @@
 AWS CloudWatch adapter — fetches alarm data for Operational Excellence checks.
 """
 
-import boto3
 from botocore.exceptions import ClientError
 
+from infra_review_cli.adapters.aws.session import aws_client
 from infra_review_cli.core.checks.operational_excellence import check_cloudwatch_alarms
 
 
 def fetch_cloudwatch_alarm_findings(region: str) -> list:
     """Fetches CloudWatch alarms and checks whether any are configured."""
-    cw = boto3.client("cloudwatch", region_name=region)
+    cw = aws_client("cloudwatch", region_name=region)
 
     try:
         paginator = cw.get_paginator("describe_alarms")
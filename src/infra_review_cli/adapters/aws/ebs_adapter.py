@@ -3,16 +3,16 @@
 AWS EBS adapter — fetches unattached volume data.
 """
 
-import boto3
 from botocore.exceptions import ClientError
 
+from infra_review_cli.adapters.aws.session import aws_client
 from infra_review_cli.core.checks.ec2 import check_unattached_ebs
 from infra_review_cli.config import EBS_MIN_AGE_DAYS
 
 
 def fetch_ebs_findings(region: str) -> list:
     """Fetches unattached EBS volumes and runs check_unattached_ebs()."""
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = aws_client("ec2", region_name=region)
     volumes = []
 
     try:
@@ -4,10 +4,10 @@ AWS EC2 adapter — fetches CPU metrics, EBS volumes, and Elastic IP data.
 """
 
 import json
-import boto3
 from datetime import datetime, timedelta, timezone
 from botocore.exceptions import ClientError
 
+from infra_review_cli.adapters.aws.session import aws_client
 from infra_review_cli.core.checks.ec2 import (
     check_ec2_rightsizing,
     check_unattached_ebs,
@@ -37,7 +37,7 @@ def fetch_price_from_aws(instance_type: str, region: str) -> float:
     if not location:
         return 0.0
 
-    pricing = boto3.client("pricing", region_name="us-east-1")
+    pricing = aws_client("pricing", region_name="us-east-1")
     try:
         response = pricing.get_products(
             ServiceCode="AmazonEC2",
@@ -71,8 +71,8 @@ def fetch_cpu_data(region: str, threshold: float = CPU_UNDERUTIL_THRESHOLD) -> l
     Fetches running EC2 instances + 14-day CPU metrics and returns check findings.
     Gracefully handles AccessDenied per-call.
     """
-    ec2 = boto3.client("ec2", region_name=region)
-    cloudwatch = boto3.client("cloudwatch", region_name=region)
+    ec2 = aws_client("ec2", region_name=region)
+    cloudwatch = aws_client("cloudwatch", region_name=region)
     instances = []
 
     try:
@@ -136,7 +136,7 @@ def fetch_cpu_data(region: str, threshold: float = CPU_UNDERUTIL_THRESHOLD) -> l
 
 def fetch_unassociated_eips(region: str) -> list:
     """Fetches all Elastic IPs and returns findings for unassociated ones."""
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = aws_client("ec2", region_name=region)
     try:
         addresses = ec2.describe_addresses()["Addresses"]
         return check_unassociated_elastic_ips(addresses, region)
@@ -150,7 +150,7 @@ def fetch_unassociated_eips(region: str) -> list:
 
 def fetch_asg_instance_ids(region: str) -> set[str]:
     """Returns the set of instance IDs that are part of an Auto Scaling Group."""
-    asg = boto3.client("autoscaling", region_name=region)
+    asg = aws_client("autoscaling", region_name=region)
     instance_ids: set[str] = set()
     try:
         paginator = asg.get_paginator("describe_auto_scaling_instances")
@@ -167,7 +167,7 @@ def fetch_asg_instance_ids(region: str) -> set[str]:
 
 def fetch_asg_findings(region: str) -> list:
     """Orchestrates the ASG coverage check."""
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = aws_client("ec2", region_name=region)
     try:
         # Get all running instance IDs
         instances = ec2.describe_instances(Filters=[{"Name": "instance-state-name", "Values": ["running"]}])
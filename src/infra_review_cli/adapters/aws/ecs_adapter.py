@@ -3,11 +3,11 @@
 AWS ECS adapter — fetches data for task definition drift, unused services, and rightsizing.
 """
 
-import boto3
 from botocore.exceptions import ClientError
 
+from infra_review_cli.adapters.aws.session import aws_client
 from infra_review_cli.core.checks.ecs import (
-    check_ecs_task_definition_drift,
+    check_ecs_task_definition_drift_deferred,
     check_unused_services,
     check_overprovisioned_task,
     check_task_running_as_root,
@@ -20,9 +20,9 @@ def fetch_ecs_findings(region: str) -> list:
     """
     Orchestrates all ECS-related checks.
     """
-    ecs = boto3.client("ecs", region_name=region)
-    cw = boto3.client("cloudwatch", region_name=region)
-    asg = boto3.client("application-autoscaling", region_name=region)
+    ecs = aws_client("ecs", region_name=region)
+    cw = aws_client("cloudwatch", region_name=region)
+    asg = aws_client("application-autoscaling", region_name=region)
     findings = []
 
     try:
@@ -75,7 +75,7 @@ def fetch_ecs_findings(region: str) -> list:
                             td_family = td["family"]
                             latest_td_arn = ecs.describe_task_definition(taskDefinition=td_family)["taskDefinition"]["taskDefinitionArn"]
                             if current_td_arn != latest_td_arn:
-                                findings.extend(check_ecs_task_definition_drift(
+                                findings.extend(check_ecs_task_definition_drift_deferred(
                                     svc_name,
                                     current_td_arn.split(":")[-1],
                                     latest_td_arn.split(":")[-1],
@@ -3,10 +3,10 @@
 AWS ELB adapter — fetches data for unused load balancer check.
 """
 
-import boto3
 from datetime import datetime, timedelta, timezone
 from botocore.exceptions import ClientError
 
+from infra_review_cli.adapters.aws.session import aws_client
 from infra_review_cli.core.checks.elb import check_unused_elb
 
 
@@ -15,8 +15,8 @@ def fetch_elb_findings(region: str) -> list:
     Fetches all ELBs (ALB/NLB), gets their request counts and healthy target counts,
     and returns findings.
     """
-    elbv2 = boto3.client("elbv2", region_name=region)
-    cw = boto3.client("cloudwatch", region_name=region)
+    elbv2 = aws_client("elbv2", region_name=region)
+    cw = aws_client("cloudwatch", region_name=region)
     elbs_data = []
 
     try:
@@ -84,7 +84,7 @@ def fetch_elb_findings(region: str) -> list:
 
 def fetch_alb_dns_names(region: str) -> list[str]:
     """Returns DNS names of all Application Load Balancers (used for CloudFront check)."""
-    elbv2 = boto3.client("elbv2", region_name=region)
+    elbv2 = aws_client("elbv2", region_name=region)
     try:
         lbs = elbv2.describe_load_balancers()["LoadBalancers"]
         return [lb["DNSName"] for lb in lbs if lb["Type"] == "application"]
@@ -6,40 +6,46 @@ AWS IAM adapter — fetches data for IAM-related checks.
 import csv
 import io
 import time
-import boto3
+from collections.abc import Iterator
+
 from botocore.exceptions import ClientError
 
+from infra_review_cli.adapters.aws.session import aws_client
 from infra_review_cli.core.checks.iam import check_iam_mfa, check_root_account_activity
 
 
+def _iter_users_with_mfa(iam) -> Iterator[dict]:
+    """Yields each IAM user with their MFA devices, one page at a time."""
+    paginator = iam.get_paginator("list_users")
+    for page in paginator.paginate():
+        for user in page.get("Users", []):
+            username = user["UserName"]
+            # Check if they have a console password (PasswordLastUsed is set if they do)
+            try:
+                mfa_resp = iam.list_mfa_devices(UserName=username)
+                mfa_devices = mfa_resp.get("MFADevices", [])
+            except ClientError:
+                mfa_devices = []
+
+            yield {
+                "UserName": username,
+                "UserId": user["UserId"],
+                "PasswordLastUsed": user.get("PasswordLastUsed"),
+                "MFADevices": mfa_devices,
+                "ConsoleAccess": user.get("PasswordLastUsed") is not None,
+            }
+
+
 def fetch_iam_mfa_findings(region: str = "global") -> list:
     """
     Lists all IAM users and their MFA devices, then runs check_iam_mfa().
 
     IAM is a global service — region is only used for the Finding region field.
     """
-    iam = boto3.client("iam")
-    users_with_mfa = []
+    iam = aws_client("iam")
 
     try:
-        paginator = iam.get_paginator("list_users")
-        for page in paginator.paginate():
-            for user in page.get("Users", []):
-                username = user["UserName"]
-                # Check if they have a console password (PasswordLastUsed is set if they do)
-                try:
-                    mfa_resp = iam.list_mfa_devices(UserName=username)
-                    mfa_devices = mfa_resp.get("MFADevices", [])
-                except ClientError:
-                    mfa_devices = []
-
-                users_with_mfa.append({
-                    "UserName": username,
-                    "UserId": user["UserId"],
-                    "PasswordLastUsed": user.get("PasswordLastUsed"),
-                    "MFADevices": mfa_devices,
-                    "ConsoleAccess": user.get("PasswordLastUsed") is not None,
-                })
+        return check_iam_mfa(_iter_users_with_mfa(iam), region)
     except ClientError as e:
         code = e.response["Error"]["Code"]
         if code == "AccessDenied":
@@ -51,14 +57,12 @@ def fetch_iam_mfa_findings(region: str = "global") -> list:
             print(f"⚠️  IAM: {e}")
         return []
 
-    return check_iam_mfa(users_with_mfa, region)
-
 
 def fetch_root_activity_findings(region: str = "global") -> list:
     """
     Generates and retrieves the IAM credential report, then checks root account activity.
     """
-    iam = boto3.client("iam")
+    iam = aws_client("iam")
 
     try:
         # Trigger report generation
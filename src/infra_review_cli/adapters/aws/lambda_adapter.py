@@ -3,26 +3,27 @@
 AWS Lambda adapter — fetches function data for secrets check.
 """
 
-import boto3
+from itertools import chain
+
 from botocore.exceptions import ClientError
 
+from infra_review_cli.adapters.aws.session import aws_client
 from infra_review_cli.core.checks.operational_excellence import check_secrets_in_lambda_env
 
 
 def fetch_lambda_findings(region: str) -> list:
     """Fetches Lambda functions and checks for secrets in env vars."""
-    client = boto3.client("lambda", region_name=region)
-    functions = []
+    client = aws_client("lambda", region_name=region)
 
     try:
         paginator = client.get_paginator("list_functions")
-        for page in paginator.paginate():
-            functions.extend(page.get("Functions", []))
+        functions = chain.from_iterable(
+            page.get("Functions", []) for page in paginator.paginate()
+        )
+        return check_secrets_in_lambda_env(functions, region)
     except ClientError as e:
         if e.response["Error"]["Code"] == "AccessDenied":
             print("⚠️  Lambda check skipped — missing permission: lambda:ListFunctions")
         else:
             print(f"⚠️  Lambda: {e}")
         return []
-
-    return check_secrets_in_lambda_env(functions, region)
@@ -3,9 +3,9 @@
 AWS RDS adapter — fetches data for RDS reliability checks.
 """
 
-import boto3
 from botocore.exceptions import ClientError
 
+from infra_review_cli.adapters.aws.session import aws_client
 from infra_review_cli.core.checks.rds import check_rds_multi_az, check_rds_backup_policy
 
 
@@ -15,7 +15,7 @@ def fetch_rds_findings(region: str) -> list:
       - check_rds_multi_az
       - check_rds_backup_policy
     """
-    rds = boto3.client("rds", region_name=region)
+    rds = aws_client("rds", region_name=region)
     findings = []
 
     try:
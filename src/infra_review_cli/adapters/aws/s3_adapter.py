@@ -3,12 +3,39 @@
 AWS S3 adapter — fetches public access and versioning data.
 """
 
-import boto3
+import threading
+from functools import lru_cache
+
 from botocore.exceptions import ClientError
 
+from infra_review_cli.adapters.aws.session import aws_client
 from infra_review_cli.core.checks.s3 import check_s3_public_access, check_s3_versioning
 
 
+_BUCKETS_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _list_bucket_names(region: str) -> tuple[str, ...]:
+    s3 = aws_client("s3", region_name=region)
+    return tuple(b["Name"] for b in s3.list_buckets().get("Buckets", []))
+
+
+def list_bucket_names(region: str) -> tuple[str, ...]:
+    """
+    Bucket names from one ListBuckets call, shared by the public-access, versioning
+    and lifecycle fetchers. Raises ClientError like list_buckets; failures aren't cached.
+    """
+    # The fetchers run concurrently; the lock makes the first one do the call for all
+    with _BUCKETS_LOCK:
+        return _list_bucket_names(region)
+
+
+def clear_bucket_cache() -> None:
+    """Forget cached bucket listings so the next scan sees fresh data."""
+    _list_bucket_names.cache_clear()
+
+
 def fetch_s3_public_info(region: str) -> tuple[list, list[str]]:
     """
     Checks all S3 buckets for public access.
@@ -17,12 +44,11 @@ def fetch_s3_public_info(region: str) -> tuple[list, list[str]]:
         Tuple of (findings: list[Finding], public_bucket_names: list[str])
         Public bucket names are returned so the CloudFront adapter can reuse them.
     """
-    s3 = boto3.client("s3", region_name=region)
+    s3 = aws_client("s3", region_name=region)
     findings_input = []
 
     try:
-        response = s3.list_buckets()
-        buckets = response.get("Buckets", [])
+        buckets = list_bucket_names(region)
     except ClientError as e:
         if e.response["Error"]["Code"] == "AccessDenied":
             print("⚠️  S3 check skipped — missing permission: s3:ListAllMyBuckets")
@@ -30,8 +56,7 @@ def fetch_s3_public_info(region: str) -> tuple[list, list[str]]:
             print(f"⚠️  S3: {e}")
         return [], []
 
-    for bucket in buckets:
-        name = bucket["Name"]
+    for name in buckets:
         is_public = False
         reason = None
 
@@ -68,18 +93,17 @@ def fetch_s3_public_info(region: str) -> tuple[list, list[str]]:
 
 def fetch_s3_versioning_findings(region: str) -> list:
     """Checks all S3 buckets for versioning status."""
-    s3 = boto3.client("s3", region_name=region)
+    s3 = aws_client("s3", region_name=region)
     buckets_with_versioning = []
 
     try:
-        all_buckets = s3.list_buckets().get("Buckets", [])
+        all_buckets = list_bucket_names(region)
     except ClientError as e:
         if e.response["Error"]["Code"] == "AccessDenied":
             print("⚠️  S3 versioning check skipped — missing: s3:ListAllMyBuckets")
         return []
 
-    for bucket in all_buckets:
-        name = bucket["Name"]
+    for name in all_buckets:
         try:
             versioning = s3.get_bucket_versioning(Bucket=name)
             status = versioning.get("Status", "")
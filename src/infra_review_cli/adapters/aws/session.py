@@ -0,0 +1,22 @@
+# src/infra_review_cli/adapters/aws/session.py
+"""
+Thread-safe boto3 client creation for the AWS adapters.
+
+run_scan executes the adapters concurrently. boto3 clients are safe to share
+between threads, but the Session that creates them is not: `boto3.client()`
+goes through the shared default session, whose credential and endpoint
+loading can race. Every adapter creates its clients through `aws_client`,
+which serialises creation; API calls on the returned clients run in parallel.
+"""
+
+import threading
+
+import boto3
+
+_lock = threading.Lock()
+
+
+def aws_client(service_name: str, region_name: str | None = None):
+    """boto3.client(service_name, region_name=...), created under a process-wide lock."""
+    with _lock:
+        return boto3.client(service_name, region_name=region_name)
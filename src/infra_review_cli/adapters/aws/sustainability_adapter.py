@@ -11,10 +11,11 @@ permissions/API failures) and should not increment pillar check count.
 from datetime import datetime, timedelta, timezone
 import time
 
-import boto3
 from botocore.exceptions import ClientError
 
 from infra_review_cli.adapters.aws.ec2_adapter import fetch_price_from_aws
+from infra_review_cli.adapters.aws.s3_adapter import list_bucket_names
+from infra_review_cli.adapters.aws.session import aws_client
 from infra_review_cli.config import CLOUDWATCH_LOOKBACK_DAYS
 from infra_review_cli.core.checks.sustainability import (
     check_graviton_instance_usage,
@@ -101,7 +102,7 @@ def _query_lambda_max_memory_used(logs, function_name: str, start: datetime, end
 
 
 def fetch_graviton_usage_findings(region: str) -> tuple[list, bool]:
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = aws_client("ec2", region_name=region)
     instances: list[dict] = []
 
     try:
@@ -128,13 +129,13 @@ def fetch_graviton_usage_findings(region: str) -> tuple[list, bool]:
 
 
 def fetch_s3_lifecycle_findings(region: str) -> tuple[list, bool]:
-    s3 = boto3.client("s3", region_name=region)
+    s3 = aws_client("s3", region_name=region)
     buckets_input: list[dict] = []
     checked_any_bucket = False
     access_denied_buckets = 0
 
     try:
-        buckets = s3.list_buckets().get("Buckets", [])
+        buckets = list_bucket_names(region)
     except ClientError as e:
         if _is_access_denied(e):
             print("⚠️  Sustainability S3 lifecycle check skipped — missing: s3:ListAllMyBuckets")
@@ -142,8 +143,7 @@ def fetch_s3_lifecycle_findings(region: str) -> tuple[list, bool]:
             print(f"⚠️  Sustainability S3 lifecycle check failed: {e}")
         return [], False
 
-    for bucket in buckets:
-        name = bucket.get("Name", "unknown")
+    for name in buckets:
         has_rules = False
         try:
             response = s3.get_bucket_lifecycle_configuration(Bucket=name)
@@ -171,8 +171,8 @@ def fetch_s3_lifecycle_findings(region: str) -> tuple[list, bool]:
 
 
 def fetch_idle_always_on_findings(region: str) -> tuple[list, bool]:
-    ec2 = boto3.client("ec2", region_name=region)
-    cloudwatch = boto3.client("cloudwatch", region_name=region)
+    ec2 = aws_client("ec2", region_name=region)
+    cloudwatch = aws_client("cloudwatch", region_name=region)
 
     try:
         paginator = ec2.get_paginator("describe_instances")
@@ -231,8 +231,8 @@ def fetch_idle_always_on_findings(region: str) -> tuple[list, bool]:
 
 
 def fetch_lambda_memory_findings(region: str) -> tuple[list, bool]:
-    lambda_client = boto3.client("lambda", region_name=region)
-    logs = boto3.client("logs", region_name=region)
+    lambda_client = aws_client("lambda", region_name=region)
+    logs = aws_client("logs", region_name=region)
 
     try:
         paginator = lambda_client.get_paginator("list_functions")
@@ -269,7 +269,7 @@ def fetch_lambda_memory_findings(region: str) -> tuple[list, bool]:
 
 
 def fetch_unencrypted_ebs_findings(region: str) -> tuple[list, bool]:
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = aws_client("ec2", region_name=region)
     volumes: list[dict] = []
 
     try:
@@ -3,31 +3,38 @@
 AWS Resource Groups Tagging API adapter — checks for missing required tags.
 """
 
-import boto3
+from collections.abc import Iterator
+
 from botocore.exceptions import ClientError
 
+from infra_review_cli.adapters.aws.session import aws_client
 from infra_review_cli.core.checks.operational_excellence import check_resource_tagging
 from infra_review_cli.config import REQUIRED_TAGS
 
 
+def _iter_resources(tagging) -> Iterator[dict]:
+    """Yields tagged resources page by page instead of materialising the full inventory."""
+    paginator = tagging.get_paginator("get_resources")
+    for page in paginator.paginate(
+        TagFilters=[],  # No filter — get all resources
+        ResourcesPerPage=100,
+    ):
+        for resource in page.get("ResourceTagMappingList", []):
+            yield {
+                "ResourceARN": resource["ResourceARN"],
+                "Tags": resource.get("Tags", []),
+            }
+
+
 def fetch_tagging_findings(region: str) -> list:
     """
     Uses the Resource Groups Tagging API to list resources missing required tags.
     """
-    tagging = boto3.client("resourcegroupstaggingapi", region_name=region)
-    resources = []
+    tagging = aws_client("resourcegroupstaggingapi", region_name=region)
 
+    # The check consumes the generator inside the try so paging errors are still caught
     try:
-        paginator = tagging.get_paginator("get_resources")
-        for page in paginator.paginate(
-            TagFilters=[],  # No filter — get all resources
-            ResourcesPerPage=100,
-        ):
-            for resource in page.get("ResourceTagMappingList", []):
-                resources.append({
-                    "ResourceARN": resource["ResourceARN"],
-                    "Tags": resource.get("Tags", []),
-                })
+        return check_resource_tagging(_iter_resources(tagging), REQUIRED_TAGS, region)
     except ClientError as e:
         code = e.response["Error"]["Code"]
         if code == "AccessDenied":
@@ -35,5 +42,3 @@ def fetch_tagging_findings(region: str) -> list:
         else:
             print(f"⚠️  Tagging API: {e}")
         return []
-
-    return check_resource_tagging(resources, REQUIRED_TAGS, region)
@@ -3,15 +3,15 @@
 AWS VPC adapter — fetches security group rules.
 """
 
-import boto3
 from botocore.exceptions import ClientError
 
+from infra_review_cli.adapters.aws.session import aws_client
 from infra_review_cli.core.checks.vpc import check_insecure_sg_rules
 
 
 def fetch_vpc_findings(region: str) -> list:
     """Fetches all Security Groups and checks for insecure rules."""
-    ec2 = boto3.client("ec2", region_name=region)
+    ec2 = aws_client("ec2", region_name=region)
     findings = []
 
     try:
@@ -4,21 +4,25 @@ Registry for cloud providers.
 The CLI uses this to discover available providers without hardcoding them.
 """
 
-from typing import Type
-from infra_review_cli.core.base_provider import BaseCloudProvider
-from infra_review_cli.adapters.aws.aws_provider import AWSProvider
+from importlib import import_module
+from typing import TYPE_CHECKING, Type
 
-# Map of provider_id (str) -> Provider Class
-PROVIDERS: dict[str, Type[BaseCloudProvider]] = {
-    "aws": AWSProvider,
+if TYPE_CHECKING:
+    from infra_review_cli.core.base_provider import BaseCloudProvider
+
+# Map of provider_id (str) -> "module:Class". Providers are imported on first use,
+# so `--help` and argument errors don't pay for boto3 and the provider adapters.
+PROVIDERS: dict[str, str] = {
+    "aws": "infra_review_cli.adapters.aws.aws_provider:AWSProvider",
 }
 
-def get_provider(provider_id: str) -> Type[BaseCloudProvider]:
+def get_provider(provider_id: str) -> Type["BaseCloudProvider"]:
     """Returns the provider class for the given ID."""
-    provider_cls = PROVIDERS.get(provider_id.lower())
-    if not provider_cls:
+    target = PROVIDERS.get(provider_id.lower())
+    if not target:
         raise ValueError(f"Unknown cloud provider: {provider_id}. Available: {list(PROVIDERS.keys())}")
-    return provider_cls
+    module_name, class_name = target.split(":")
+    return getattr(import_module(module_name), class_name)
 
 def list_providers() -> list[str]:
     """Returns the list of registered provider IDs."""
@@ -7,6 +7,7 @@ Supports both interactive prompts and flag-based automation.
 import os
 import sys
 import webbrowser
+from pathlib import Path
 from typing import Optional
 
 import click
@@ -38,6 +39,13 @@ custom_theme = Theme({
 
 console = Console(theme=custom_theme)
 
+# Output format → renderer; its keys are also the accepted --format choices
+_FORMATTERS = {
+    "text": lambda result: format_as_text(result.findings),
+    "json": lambda result: format_as_json(result.findings),
+    "html": format_as_html,  # takes the whole ScanResult
+}
+
 
 def display_rich_summary(result: ScanResult):
     """Prints a beautiful summary table to the console."""
@@ -80,17 +88,21 @@ def cli():
 @cli.command()
 @click.argument("provider", type=click.Choice(list_providers()), default="aws")
 @click.option("--region", default="us-east-1", help="AWS region or Provider-specific region ID.")
-@click.option("--format", "fmt", type=click.Choice(["text", "json", "html"]), default="text", help="Output format.")
+@click.option("--format", "fmt", type=click.Choice(list(_FORMATTERS)), default="text", help="Output format.")
 @click.option("--output", "-o", help="Save report to this file.")
 @click.option("--pillar", "-p", multiple=True, help="Filter by pillar (e.g., Security, Cost Optimization).")
 @click.option("--severity", "-s", multiple=True, help="Filter by severity (e.g., Critical, High).")
 @click.option("--dry-run", is_flag=True, help="Show which checks would run without executing them.")
 @click.option("--interactive", "-i", is_flag=True, help="Run in interactive prompt mode.")
+@click.option("--no-ai-cache", is_flag=True, help="Call the AI provider fresh instead of reusing cached responses.")
 
 
-def check(provider, region, fmt, output, pillar, severity, dry_run, interactive):
+def check(provider, region, fmt, output, pillar, severity, dry_run, interactive, no_ai_cache):
     """Run infrastructure security and cost optimization checks."""
-    
+    if no_ai_cache:
+        from .core.ai import disk_cache
+        disk_cache.disable()
+
     if interactive or (not interactive and len(sys.argv) == 2):
         # Fallback to interactive mode if no options provided or explicitly requested
         provider, region, fmt, output, pillar, severity = run_interactive_prompts()
@@ -130,12 +142,8 @@ def check(provider, region, fmt, output, pillar, severity, dry_run, interactive)
         return
 
     # Handle Output
-    if fmt == "json":
-        content = format_as_json(scan_result.findings)
-    elif fmt == "html":
-        content = format_as_html(scan_result)  # Passing the whole ScanResult now!
-    else:
-        content = format_as_text(scan_result.findings)
+    content = _FORMATTERS.get(fmt, _FORMATTERS["text"])(scan_result)
+    if fmt not in ("json", "html"):
         display_rich_summary(scan_result)
 
     if fmt == "html" and not output:
@@ -143,8 +151,8 @@ def check(provider, region, fmt, output, pillar, severity, dry_run, interactive)
 
     if output:
         try:
-            with open(output, "w", encoding="utf-8") as f:
-                f.write(content)
+            # The report is already fully built: encode it once and write it in one call
+            Path(output).write_bytes(content.encode("utf-8"))
             console.print(f"\n[success]✅ Report saved to {output}[/]")
             if fmt == "html":
                 webbrowser.open('file://' + os.path.abspath(output))
@@ -169,7 +177,7 @@ def run_interactive_prompts():
     
     fmt = questionary.select(
         "Output format?",
-        choices=["text", "json", "html"],
+        choices=list(_FORMATTERS),
         default="text"
     ).ask()
     
@@ -17,6 +17,25 @@ ANTHROPIC_API_KEY: str | None = os.getenv("ANTHROPIC_API_KEY")
 GEMINI_API_KEY: str | None = os.getenv("GEMINI_API_KEY")
 OPENAI_API_KEY: str | None = os.getenv("OPENAI_API_KEY")
 
+# Maximum number of AI requests in flight at once (provider rate limits)
+AI_MAX_CONCURRENCY: int = int(os.getenv("AI_MAX_CONCURRENCY", "10"))
+
+# How long cached AI responses are reused across scans (default 7 days)
+AI_CACHE_TTL_SECONDS: int = int(os.getenv("AI_CACHE_TTL_SECONDS", str(7 * 86400)))
+
+# ---------------------------------------------------------------------------
+# Scan Concurrency
+# ---------------------------------------------------------------------------
+# Worker threads used to run independent scan steps concurrently (mostly AWS API I/O)
+SCAN_MAX_WORKERS: int = int(os.getenv("SCAN_MAX_WORKERS", str(min(32, 4 * (os.cpu_count() or 1)))))
+
+# ---------------------------------------------------------------------------
+# Finding IDs
+# ---------------------------------------------------------------------------
+# Finding IDs are a truncated BLAKE2b digest. Set this to keep the older
+# SHA-256-based IDs, e.g. when diffing JSON reports against scans made before the switch.
+LEGACY_FINDING_IDS: bool = os.getenv("INFRA_REVIEW_LEGACY_FINDING_IDS", "").lower() in ("true", "1", "yes")
+
 # ---------------------------------------------------------------------------
 # EC2 / CloudWatch Thresholds
 # ---------------------------------------------------------------------------
@@ -1,9 +1,11 @@
-from .llm_client import call_ai
-from infra_review_cli.utils.utility import extract_number
+from .llm_client import ai_executor, call_ai
+from infra_review_cli.utils.utility import extract_number_f
 
+_FALLBACK_SAVINGS = 10.0
 
-def estimate_savings(resource_type: str, usage: str, region: str, instance_id: str = "") -> float:
-    prompt = f"""
+
+def _savings_prompt(resource_type: str, usage: str, region: str) -> str:
+    return f"""
     Estimate how much money (in USD) could be saved monthly if the following AWS resource is removed or downsized:
 
     - Resource: {resource_type}
@@ -13,11 +15,44 @@ def estimate_savings(resource_type: str, usage: str, region: str, instance_id: s
     Respond with just the dollar amount as a number. No extra text.
     """
 
-    result = call_ai(prompt)
+
+def _parse_savings(result: str | None) -> float:
     if result:
         try:
-            return float(extract_number(result))
+            return extract_number_f(result)
         except (ValueError, TypeError):
             pass
 
-    return 10.0  # fallback
+    return _FALLBACK_SAVINGS  # fallback
+
+
+def estimate_savings(resource_type: str, usage: str, region: str, instance_id: str = "") -> float:
+    return _parse_savings(call_ai(_savings_prompt(resource_type, usage, region)))
+
+
+def estimate_savings_bulk(items: list[tuple[str, str, str]]) -> list[float]:
+    """
+    Estimate savings for many (resource_type, usage, region) tuples at once.
+
+    The prompt does not depend on the individual resource, so identical tuples
+    share one AI call; the distinct ones are resolved concurrently.
+    Returns estimates in the same order as `items`.
+    """
+    unique = list(dict.fromkeys(items))
+    if not unique:
+        return []
+
+    # On the shared AI thread pool (at most AI_MAX_CONCURRENCY in flight) rather than
+    # asyncio.run, so this also works when the caller is already running an event loop
+    futures = [ai_executor().submit(call_ai, _savings_prompt(*key)) for key in unique]
+    replies = []
+    for future in futures:
+        try:
+            replies.append(future.result())
+        except Exception:
+            replies.append(None)
+    estimates = {
+        key: _parse_savings(raw)
+        for key, raw in zip(unique, replies)
+    }
+    return [estimates[item] for item in items]
@@ -0,0 +1,111 @@
+# src/infra_review_cli/core/ai/disk_cache.py
+"""
+Content-addressed on-disk cache for AI responses.
+
+Repeated scans of the same account surface the same findings, so the prompts
+sent to the LLM are often byte-identical between runs. Responses are stored in
+a small SQLite table (WAL mode) keyed by a sha256 of the prompt and the model
+chain, so a re-run reads from disk instead of making a network round-trip.
+
+Location: $XDG_CACHE_HOME/infra-review-cli/ai/ (defaults to ~/.cache/...).
+Set INFRA_REVIEW_NO_AI_CACHE=1 (or pass --no-ai-cache) to disable. Cache failures never break a scan —
+they just fall through to calling `compute`.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from infra_review_cli.config import AI_CACHE_TTL_SECONDS
+from infra_review_cli.utils.utility import cache_root
+
+logger = logging.getLogger(__name__)
+
+_DISABLED = os.getenv("INFRA_REVIEW_NO_AI_CACHE", "").lower() in ("true", "1", "yes")
+
+_conn: sqlite3.Connection | None = None
+_lock = threading.Lock()
+
+
+def cache_dir() -> Path:
+    """Directory holding the AI response cache."""
+    return cache_root() / "ai"
+
+
+def disable() -> None:
+    """Bypass the cache for the rest of the process (the CLI's --no-ai-cache)."""
+    global _DISABLED
+    _DISABLED = True
+
+
+def make_key(*parts: str) -> str:
+    """sha256 over the given parts (prompt, model chain, schema, ...)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _connection() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        path = cache_dir()
+        path.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path / "responses.sqlite3", check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        _conn = conn
+    return _conn
+
+
+def get_or_compute(
+    key: str,
+    compute: Callable[[], str | None],
+    ttl_s: int = AI_CACHE_TTL_SECONDS,
+    validate: Callable[[str], bool] | None = None,
+) -> str | None:
+    """
+    Return the cached value for `key` if it is younger than `ttl_s`, otherwise
+    call `compute()` and store its result. None results, and results `validate`
+    rejects, are returned but never cached, so a transient provider outage or a
+    malformed reply doesn't stick. Expired rows are purged on each write.
+    """
+    if _DISABLED:
+        return compute()
+
+    try:
+        with _lock:
+            row = _connection().execute(
+                "SELECT value, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row and time.time() - row[1] < ttl_s:
+            return row[0]
+    except (sqlite3.Error, OSError) as e:
+        logger.debug("AI cache read failed: %s", e)
+
+    value = compute()
+    if value is None or (validate is not None and not validate(value)):
+        return value
+
+    try:
+        now = time.time()
+        with _lock:
+            conn = _connection()
+            conn.execute("DELETE FROM responses WHERE created < ?", (now - ttl_s,))
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created) VALUES (?, ?, ?)",
+                (key, value, now),
+            )
+            conn.commit()
+    except (sqlite3.Error, OSError) as e:
+        logger.debug("AI cache write failed: %s", e)
+    return value
@@ -1,6 +1,7 @@
+import logging
 import re
 
-
+logger = logging.getLogger(__name__)
 
 
 
@@ -106,7 +107,7 @@ Your entire response MUST be ONLY the following key-value pairs in this exact fo
     suggestion = _parse_ec2_suggestion(response_text)
 
     if not response_text or not isinstance(response_text, str):
-        print(f"⚠️ AI call returned invalid response for {instance_id}. Got: {response_text}")
+        logger.debug("AI call returned invalid response for %s: %r", instance_id, response_text)
         return {}  # No suggestion
 
     return suggestion
@@ -1,6 +1,7 @@
+import logging
 import re
 
-
+logger = logging.getLogger(__name__)
 
 
 def extract_cpu_memory_savings(response_text: str) -> dict:
@@ -9,7 +10,7 @@ def extract_cpu_memory_savings(response_text: str) -> dict:
     Handles both keyword-based and line-based formats.
     """
     try:
-        print("🧪 Parsing response:", response_text)
+        logger.debug("Parsing Fargate suggestion: %r", response_text)
         lines = [line.strip() for line in response_text.strip().splitlines() if line.strip()]
 
         cpu = None
@@ -37,11 +38,11 @@ def extract_cpu_memory_savings(response_text: str) -> dict:
 
         # Fallback: validate values
         if cpu not in [256, 512, 1024, 2048, 4096]:
-            print("⚠️ Invalid CPU value from AI")
+            logger.debug("Invalid CPU value from AI: %s", cpu)
             cpu = None
 
         if mem not in list(range(512, 30721, 512)):
-            print("⚠️ Invalid memory value from AI")
+            logger.debug("Invalid memory value from AI: %s", mem)
             mem = None
 
         if cpu is None or mem is None:
@@ -53,7 +54,7 @@ def extract_cpu_memory_savings(response_text: str) -> dict:
             "estimated_savings": round(savings, 2)
         }
     except Exception as e:
-        print("⚠️ Failed to extract CPU/memory/savings:", e)
+        logger.debug("Failed to extract CPU/memory/savings: %s", e)
         return None
 
 
@@ -99,12 +100,12 @@ def suggest_cpu_memory(cpu, mem, avg_cpu, avg_mem):
     suggestion = extract_cpu_memory_savings(response)
 
     if suggestion is None:
-        print("⚠️ Could not extract a valid suggestion.")
+        logger.debug("Could not extract a valid Fargate suggestion")
         return None
 
     # Check if AI just echoed the same input
     if suggestion["cpu"] == cpu and suggestion["memory"] == mem:
-        print("ℹ️ Already using minimum config or no better suggestion found.")
+        logger.debug("Already using minimum config or no better suggestion found")
         suggestion[
             "note"] = "Already at smallest Fargate config. Consider shutting down idle tasks or switching to Lambda if idle."
 
@@ -6,63 +6,116 @@ No credentials are required — if all providers fail, the tool still works full
 it just won't have AI-generated suggestions.
 """
 
+import json
+import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from dotenv import load_dotenv
 
+from infra_review_cli.config import AI_MAX_CONCURRENCY
+from .disk_cache import get_or_compute, make_key
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 _NO_AI = os.getenv("INFRA_REVIEW_NO_AI", "").lower() in ("true", "1", "yes")
 
-# ---------------------------------------------------------------------------
-# Claude (Anthropic) — primary provider
-# ---------------------------------------------------------------------------
-_anthropic_client = None
-try:
-    import anthropic as _anthropic_module
-    _api_key = os.getenv("ANTHROPIC_API_KEY")
-    if _api_key:
-        _anthropic_client = _anthropic_module.Anthropic(api_key=_api_key)
-except Exception:
-    _anthropic_client = None
+# Dedicated pool for blocking provider calls. LLM requests are I/O-bound (the GIL
+# is released while waiting on the network), so threads overlap fully; a separate
+# pool bounds them independently of other work.
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
 
-# ---------------------------------------------------------------------------
-# Gemini — secondary provider
-# ---------------------------------------------------------------------------
-_gemini_model = None
-try:
-    import google.generativeai as genai
-    _gemini_key = os.getenv("GEMINI_API_KEY")
-    if _gemini_key:
-        genai.configure(api_key=_gemini_key)
-        _gemini_model = genai.GenerativeModel("gemini-2.5-flash")
-except Exception:
-    _gemini_model = None
+
+def ai_executor() -> ThreadPoolExecutor:
+    """Shared, lazily created thread pool for AI calls (AI_MAX_CONCURRENCY workers)."""
+    global _executor
+    # Checked again under the lock so two threads can't each build a pool
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=AI_MAX_CONCURRENCY, thread_name_prefix="ai")
+    return _executor
+
+
+_CLAUDE_MODEL = "claude-3-5-haiku-20241022"
+_GEMINI_MODEL = "gemini-2.5-flash"
+_OPENAI_MODEL = "gpt-4o-mini"
 
 # ---------------------------------------------------------------------------
-# OpenAI — tertiary/fallback provider
+# Provider clients. The SDKs take over a second to import between them, so each
+# is imported only if its API key is set, and only when AI is first needed.
 # ---------------------------------------------------------------------------
-_openai_client = None
-try:
-    from openai import OpenAI as _OpenAI
-    _openai_key = os.getenv("OPENAI_API_KEY")
-    if _openai_key:
-        _openai_client = _OpenAI(api_key=_openai_key)
-except Exception:
-    _openai_client = None
+
+def _make_anthropic_client():
+    """Claude (Anthropic) — primary provider."""
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        return None
+    try:
+        import anthropic
+        return anthropic.Anthropic(api_key=api_key)
+    except Exception:
+        return None
+
+
+def _make_gemini_model():
+    """Gemini — secondary provider."""
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        return None
+    try:
+        import google.generativeai as genai
+        genai.configure(api_key=api_key)
+        return genai.GenerativeModel(_GEMINI_MODEL)
+    except Exception:
+        return None
+
+
+def _make_openai_client():
+    """OpenAI — tertiary/fallback provider."""
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        return None
+    try:
+        from openai import OpenAI
+        return OpenAI(api_key=api_key)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _clients() -> tuple:
+    """(anthropic client, gemini model, openai client); None for each unconfigured provider."""
+    return _make_anthropic_client(), _make_gemini_model(), _make_openai_client()
 
 
 # ---------------------------------------------------------------------------
 # Provider call functions
 # ---------------------------------------------------------------------------
 
-def call_claude(prompt: str, model: str = "claude-3-5-haiku-20241022") -> str:
+def call_claude(
+    prompt: str,
+    model: str = _CLAUDE_MODEL,
+    json_schema: dict | None = None,
+) -> str:
     """
     Call Claude (Anthropic). Raises RuntimeError if not configured.
     Uses haiku by default for cost efficiency; callers can override to sonnet/opus.
+
+    Claude has no schema-constrained output mode, so when `json_schema` is given
+    the assistant turn is prefilled with "{" to force a bare JSON object reply.
     """
-    if not _anthropic_client:
+    client = _clients()[0]
+    if not client:
         raise RuntimeError("Claude not configured — set ANTHROPIC_API_KEY.")
-    message = _anthropic_client.messages.create(
+    messages = [{"role": "user", "content": prompt}]
+    if json_schema is not None:
+        messages.append({"role": "assistant", "content": "{"})
+    message = client.messages.create(
         model=model,
         max_tokens=1024,
         system=(
@@ -70,23 +123,39 @@ def call_claude(prompt: str, model: str = "claude-3-5-haiku-20241022") -> str:
             "AWS Well-Architected Framework. Your answers are concise, direct, "
             "and immediately actionable."
         ),
-        messages=[{"role": "user", "content": prompt}],
+        messages=messages,
     )
-    return message.content[0].text.strip()
+    text = message.content[0].text.strip()
+    return "{" + text if json_schema is not None else text
 
 
-def call_gemini(prompt: str) -> str:
+def call_gemini(prompt: str, json_schema: dict | None = None) -> str:
     """Call Gemini. Raises RuntimeError if not configured."""
-    if not _gemini_model:
+    model = _clients()[1]
+    if not model:
         raise RuntimeError("Gemini not configured — set GEMINI_API_KEY.")
-    return _gemini_model.generate_content(prompt).text.strip()
+    if json_schema is not None:
+        response = model.generate_content(
+            prompt,
+            generation_config={"response_mime_type": "application/json"},
+        )
+    else:
+        response = model.generate_content(prompt)
+    return response.text.strip()
 
 
-def call_openai(prompt: str, model: str = "gpt-4o-mini") -> str:
+def call_openai(prompt: str, model: str = _OPENAI_MODEL, json_schema: dict | None = None) -> str:
     """Call OpenAI. Raises RuntimeError if not configured."""
-    if not _openai_client:
+    client = _clients()[2]
+    if not client:
         raise RuntimeError("OpenAI not configured — set OPENAI_API_KEY.")
-    response = _openai_client.chat.completions.create(
+    extra = {}
+    if json_schema is not None:
+        extra["response_format"] = {
+            "type": "json_schema",
+            "json_schema": {"name": "response", "schema": json_schema, "strict": True},
+        }
+    response = client.chat.completions.create(
         model=model,
         messages=[
             {
@@ -100,31 +169,73 @@ def call_openai(prompt: str, model: str = "gpt-4o-mini") -> str:
             {"role": "user", "content": prompt},
         ],
         max_tokens=1024,
+        **extra,
     )
     return response.choices[0].message.content.strip()
 
 
-def call_ai(prompt: str) -> str | None:
-    """
-    Try the full provider chain: Claude → Gemini → OpenAI.
-    Returns the response string, or None if all providers fail or are unconfigured.
-    This is the primary function all other AI modules should use.
-    """
-    if _NO_AI:
-        return None
+def _model_chain() -> str:
+    """Identifies the configured providers/models, so a model change invalidates cached replies."""
+    chain = [
+        name for name, client in zip((_CLAUDE_MODEL, _GEMINI_MODEL, _OPENAI_MODEL), _clients())
+        if client
+    ]
+    return ",".join(chain)
+
 
+def _call_chain(prompt: str, json_schema: dict | None) -> str | None:
     for name, fn in [("Claude", call_claude), ("Gemini", call_gemini), ("OpenAI", call_openai)]:
         try:
-            result = fn(prompt)
+            result = fn(prompt, json_schema=json_schema)
             if result:
                 return result
         except Exception as e:
             # We catch all exceptions from providers to ensure the tool never crashes
             # because of an AI quota/network/config issue.
+            logger.debug("%s call failed: %s", name, e)
             continue
     return None
 
 
+def load_json(raw: str | None):
+    """json.loads a model reply, tolerating markdown code fences. Returns None on bad JSON."""
+    if not raw:
+        return None
+    text = raw.strip()
+    if text.startswith("```"):
+        text = text.strip("`").removeprefix("json").strip()
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+
+def _is_json(raw: str) -> bool:
+    return load_json(raw) is not None
+
+
+def call_ai(prompt: str, json_schema: dict | None = None) -> str | None:
+    """
+    Try the full provider chain: Claude → Gemini → OpenAI.
+    Returns the response string, or None if all providers fail or are unconfigured.
+    This is the primary function all other AI modules should use.
+
+    Pass `json_schema` to request structured JSON output; each provider uses its
+    native JSON mode where one exists. Callers still own parsing the reply.
+
+    Responses are cached on disk (see disk_cache), so identical prompts in
+    later scans skip the network round-trip. With `json_schema`, only replies
+    that parse as JSON are cached, so a malformed one is retried next scan.
+    """
+    if _NO_AI or not ai_available():
+        return None
+
+    schema = json.dumps(json_schema, sort_keys=True) if json_schema is not None else ""
+    key = make_key(_model_chain(), schema, prompt.strip())
+    validate = _is_json if json_schema is not None else None
+    return get_or_compute(key, lambda: _call_chain(prompt, json_schema), validate=validate)
+
+
 def ai_available() -> bool:
     """True if at least one AI provider is configured."""
-    return any([_anthropic_client, _gemini_model, _openai_client])
\ No newline at end of file
+    return any(_clients())
\ No newline at end of file
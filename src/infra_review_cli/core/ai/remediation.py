@@ -4,70 +4,258 @@ AI-powered remediation step generator and executive summary generator.
 All functions return None gracefully if no AI provider is available.
 """
 
-from .llm_client import call_ai
+import json
+from concurrent.futures import as_completed
 
+from ..models import Severity
+from .llm_client import ai_executor, call_ai, load_json
 
-def generate_ai_remediation(headline: str, description: str) -> str | None:
+# Findings per batched remediation request — keeps each prompt well inside
+# the providers' 1024-token reply budget.
+_REMEDIATION_BATCH_SIZE = 10
+
+# Structured-output schema for batched remediation. OpenAI strict mode requires
+# an object at the root, so the list is wrapped in a "remediations" key.
+_REMEDIATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "remediations": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string"},
+                    "steps": {"type": "array", "items": {"type": "string"}},
+                },
+                "required": ["id", "steps"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["remediations"],
+    "additionalProperties": False,
+}
+
+# Fused executive-summary + remediation schema used by generate_ai_report.
+_REPORT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "remediations": _REMEDIATION_SCHEMA["properties"]["remediations"],
+    },
+    "required": ["summary", "remediations"],
+    "additionalProperties": False,
+}
+
+
+def _parse_remediations(raw: str | None) -> dict[str, str]:
     """
-    Generate 1-2 concise remediation steps for a finding.
-    Returns None if no AI is available (callers should use fallback hardcoded steps).
+    Parse a JSON remediation reply into {finding_id: "- step\n- step"}.
+    Tolerates markdown code fences and a bare top-level list. Returns {} on bad JSON.
     """
-    prompt = f"""
+    data = load_json(raw)
+    items = data.get("remediations", []) if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        return {}
+
+    parsed = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        finding_id, steps = item.get("id"), item.get("steps")
+        if not finding_id or not isinstance(steps, list):
+            continue
+        steps = [str(s).strip().lstrip("- ").strip() for s in steps if str(s).strip()][:2]
+        if steps:
+            parsed[str(finding_id)] = "\n".join(f"- {s}" for s in steps)
+    return parsed
+
+
+# Stands in for a finding's resource id in prompts and in the model's steps, so one
+# reply can be reused for every resource with the same issue. Only this exact
+# placeholder is ever substituted in model output.
+_RESOURCE_PLACEHOLDER = "{resource}"
+_PLACEHOLDER_RULE = (
+    f"- Refer to the affected resource only as {_RESOURCE_PLACEHOLDER}; "
+    "it is filled in per resource afterwards"
+)
+
+
+def _templated(f) -> tuple[str, str]:
+    """Headline and description with the quoted resource id ('<id>') replaced by the placeholder."""
+    rid = f.resource_id
+    if not rid:
+        return f.headline, f.detailed_description
+    quoted, placeholder = f"'{rid}'", f"'{_RESOURCE_PLACEHOLDER}'"
+    return f.headline.replace(quoted, placeholder), f.detailed_description.replace(quoted, placeholder)
+
+
+def _issue_lines(findings: list) -> str:
+    """One compact JSON object per finding, used to list issues inside prompts."""
+    lines = []
+    for f in findings:
+        headline, description = _templated(f)
+        lines.append(json.dumps({"id": f.finding_id, "headline": headline, "description": description}))
+    return "\n".join(lines)
+
+
+def _batch_prompt(batch: list) -> str:
+    return f"""
 You are an AWS Well-Architected Framework expert.
 
-A cloud infrastructure scan found the following issue:
-- Headline: "{headline}"
-- Description: {description}
+A cloud infrastructure scan found the following issues, one JSON object per line:
+{_issue_lines(batch)}
 
-Provide exactly 1–2 short, actionable remediation steps as bullet points.
+For each issue provide 1–2 short, actionable remediation steps.
 Rules:
 - Each step must be one line only
 - Actionable — start with a verb (Enable, Delete, Restrict, Configure, etc.)
 - No explanations or justifications
-- Format: "- <step>"
+{_PLACEHOLDER_RULE}
 
-Output only the bullet points. Nothing else.
+Respond with JSON only, in the form:
+{{"remediations": [{{"id": "<issue id>", "steps": ["<step>", "<step>"]}}]}}
 """.strip()
 
-    return call_ai(prompt)
 
+def _dedupe(findings: list) -> tuple[list, dict]:
+    """
+    Collapse findings that describe the same issue on different resources
+    (e.g. many public buckets sharing one Reason) so each is sent to the model once.
+    The key is the pillar, severity and templated text, where only the quoted
+    resource id is replaced, so a short id never merges unrelated findings.
 
-def generate_executive_summary(
-    findings: list,
-    pillar_scores: dict,
-    overall_score: float,
-    account_id: str,
-    region: str,
-) -> str:
+    Returns (representatives, {representative_id: [every finding it stands for]}).
     """
-    Generate a plain-English executive summary of the full scan.
-    Suitable for a non-technical CTO/VP audience.
-    Returns a fallback string if no AI is available.
+    representatives, groups, seen = [], {}, {}
+    for f in findings:
+        key = (f.pillar, f.severity, *_templated(f))
+        rep = seen.get(key)
+        if rep is None:
+            seen[key] = f
+            representatives.append(f)
+            groups[f.finding_id] = [f]
+        else:
+            groups[rep.finding_id].append(f)
+    return representatives, groups
+
+
+def _expand(remediations: dict[str, str], groups: dict) -> dict[str, str]:
+    """
+    Give each finding its representative's steps, with the placeholder filled in with
+    its own resource id. Nothing else in the model's text is rewritten.
     """
-    finding_count = len(findings)
-    total_savings = sum(getattr(f, "estimated_savings", 0.0) for f in findings)
+    expanded = {}
+    for rep_id, members in groups.items():
+        steps = remediations.get(rep_id)
+        if not steps:
+            continue
+        for f in members:
+            expanded[f.finding_id] = steps.replace(_RESOURCE_PLACEHOLDER, f.resource_id)
+    return expanded
+
+
+def _batches(findings: list) -> list[list]:
+    return [
+        findings[start:start + _REMEDIATION_BATCH_SIZE]
+        for start in range(0, len(findings), _REMEDIATION_BATCH_SIZE)
+    ]
+
+
+def _submit_batches(batches: list[list]) -> list:
+    """Submit one batched remediation call per batch to the shared AI thread pool."""
+    executor = ai_executor()
+    return [executor.submit(call_ai, _batch_prompt(batch), _REMEDIATION_SCHEMA) for batch in batches]
+
+
+def _collect(futures: list) -> dict[str, str]:
+    """Merge parsed replies as the batch calls complete; failed or unparseable batches are skipped."""
+    remediations = {}
+    for future in as_completed(futures):
+        try:
+            remediations.update(_parse_remediations(future.result()))
+        except Exception:
+            continue
+    return remediations
+
+
+def generate_ai_remediations(findings: list) -> dict[str, str]:
+    """
+    Generate remediation steps for many findings using batched JSON-mode calls.
+    Returns {finding_id: steps}; findings the model skipped are simply absent,
+    so callers should keep their fallback steps for those.
+
+    Batches are submitted to the shared AI thread pool, so K batches take roughly
+    one round-trip of wall time instead of K.
+    """
+    representatives, duplicates = _dedupe(findings)
+    return _expand(_collect(_submit_batches(_batches(representatives))), duplicates)
+
+
+def resolve_remediations(findings: list) -> list:
+    """
+    Fill in remediation_steps for findings that have none, in place.
+    Findings the model skipped keep their empty steps. Returns `findings`.
+    """
+    pending = [f for f in findings if not f.remediation_steps]
+    stamp_remediations(pending, generate_ai_remediations(pending))
+    return findings
+
 
+def stamp_remediations(findings: list, remediations: dict[str, str]) -> None:
+    """Copy generated steps onto findings that don't already have their own."""
+    for finding in findings:
+        steps = remediations.get(finding.finding_id)
+        if steps and not finding.remediation_steps:
+            finding.remediation_steps = steps
+
+
+def _summary_facts(findings: list, pillar_scores: dict, overall_score: float, account_id: str, region: str) -> tuple[str, dict]:
+    """Return the scan-results block for the report prompt, plus the counts it was built from."""
+    total_savings = 0.0
+    critical_count = high_count = 0
+    for f in findings:
+        sev = f.severity
+        critical_count += sev is Severity.CRITICAL
+        high_count += sev is Severity.HIGH
+        total_savings += getattr(f, "estimated_savings", 0.0)
+
+    facts = {
+        "finding_count": len(findings),
+        "total_savings": total_savings,
+        "critical_count": critical_count,
+        "high_count": high_count,
+    }
     score_lines = "\n".join(
         f"  - {name}: {ps.score}/100 ({ps.label})"
         for name, ps in pillar_scores.items()
     )
-
-    critical_count = sum(1 for f in findings if f.severity.value == "Critical")
-    high_count = sum(1 for f in findings if f.severity.value == "High")
-
-    prompt = f"""
-You are a senior cloud architect writing an executive summary for a CTO.
-
+    block = f"""
 Infrastructure scan results for AWS account {account_id} in {region}:
 - Overall health score: {overall_score}/100
-- Total findings: {finding_count}
-- Critical findings: {critical_count}
-- High-severity findings: {high_count}
-- Estimated monthly savings if fixed: ${total_savings:,.2f}
+- Total findings: {facts["finding_count"]}
+- Critical findings: {facts["critical_count"]}
+- High-severity findings: {facts["high_count"]}
+- Estimated monthly savings if fixed: ${facts["total_savings"]:,.2f}
 
 Pillar scores:
 {score_lines}
+""".strip()
+    return block, facts
+
 
+def _fallback_summary(facts: dict, overall_score: float, account_id: str, region: str) -> str:
+    """Meaningful summary text for when no AI is available."""
+    return (
+        f"This infrastructure scan of AWS account {account_id} ({region}) returned "
+        f"{facts['finding_count']} finding(s) with an overall health score of {overall_score}/100. "
+        f"There are {facts['critical_count']} critical and {facts['high_count']} high-severity issues that require "
+        f"immediate attention. Addressing identified findings could save an estimated "
+        f"${facts['total_savings']:,.2f}/month."
+    )
+
+
+_SUMMARY_INSTRUCTIONS = """
 Write a 3-4 sentence executive summary:
 1. Overall health assessment (use the score and key pillar concerns)
 2. Most urgent action items (focus on critical/high findings)
@@ -76,15 +264,72 @@ Write a 3-4 sentence executive summary:
 Use plain English. No bullet points. No technical jargon. Maximum 120 words.
 """.strip()
 
-    result = call_ai(prompt)
-    if result:
-        return result
 
-    # Meaningful fallback if no AI is available
-    return (
-        f"This infrastructure scan of AWS account {account_id} ({region}) returned "
-        f"{finding_count} finding(s) with an overall health score of {overall_score}/100. "
-        f"There are {critical_count} critical and {high_count} high-severity issues that require "
-        f"immediate attention. Addressing identified findings could save an estimated "
-        f"${total_savings:,.2f}/month."
+def _report_prompt(block: str, fused: list) -> str:
+    return f"""
+You are a senior cloud architect reviewing an AWS Well-Architected scan for a CTO.
+
+{block}
+
+Task 1 — "summary":
+{_SUMMARY_INSTRUCTIONS}
+
+Task 2 — "remediations": for each issue below (one JSON object per line), provide
+1–2 short, actionable remediation steps. Each step is one line and starts with a verb.
+{_PLACEHOLDER_RULE}
+{_issue_lines(fused) or "(none)"}
+
+Respond with JSON only, in the form:
+{{"summary": "<summary>", "remediations": [{{"id": "<issue id>", "steps": ["<step>", "<step>"]}}]}}
+""".strip()
+
+
+def _report_plan(findings: list, pillar_scores: dict, overall_score: float, account_id: str, region: str):
+    """Setup for generate_ai_report: summary facts plus the fused/overflow remediation split."""
+    block, facts = _summary_facts(findings, pillar_scores, overall_score, account_id, region)
+    pending = [f for f in findings if not f.remediation_steps]
+    representatives, duplicates = _dedupe(pending)
+    fused, overflow = representatives[:_REMEDIATION_BATCH_SIZE], representatives[_REMEDIATION_BATCH_SIZE:]
+    return block, facts, fused, overflow, duplicates
+
+
+def _report_result(raw: str | None, remediations: dict, fused: list, duplicates: dict, facts: dict,
+                   overall_score: float, account_id: str, region: str) -> dict:
+    data = load_json(raw)
+    summary = data.get("summary") if isinstance(data, dict) else None
+    if fused:
+        remediations.update(_parse_remediations(raw))
+
+    return {
+        "summary": summary or _fallback_summary(facts, overall_score, account_id, region),
+        "remediations": _expand(remediations, duplicates),
+    }
+
+
+def generate_ai_report(
+    findings: list,
+    pillar_scores: dict,
+    overall_score: float,
+    account_id: str,
+    region: str,
+) -> dict:
+    """
+    Generate the executive summary and remediation steps in a single AI call.
+
+    Remediation is requested for findings without `remediation_steps`, up to one
+    batch; any overflow is resolved with batched calls submitted alongside it on
+    the AI thread pool, so this works whether or not the caller runs an event loop.
+    Returns {"summary": str, "remediations": {finding_id: steps}}; the summary
+    falls back to plain text if no AI is available.
+    """
+    block, facts, fused, overflow, duplicates = _report_plan(
+        findings, pillar_scores, overall_score, account_id, region
     )
+
+    report = ai_executor().submit(call_ai, _report_prompt(block, fused), _REPORT_SCHEMA)
+    remediations = _collect(_submit_batches(_batches(overflow)))
+    try:
+        raw = report.result()
+    except Exception:
+        raw = None
+    return _report_result(raw, remediations, fused, duplicates, facts, overall_score, account_id, region)
@@ -44,6 +44,7 @@ from typing import Optional
 
 from .models import ScanResult
 from .base_check import BaseCheck
+from .ai.remediation import generate_ai_report, stamp_remediations
 
 
 class BaseCloudProvider(ABC):
@@ -140,6 +141,32 @@ class BaseCloudProvider(ABC):
         """
         ...
 
+    def finalize_scan(self, result: ScanResult) -> ScanResult:
+        """
+        Post-process a built ScanResult once all checks have run.
+
+        Issues a single fused AI call for the executive summary and any missing
+        remediation steps, then stamps both onto the result. Providers should
+        call this at the end of run_scan rather than calling AI per finding.
+        Findings the AI left without steps get their check's `fallback_remediation`.
+        """
+        if not result.findings:
+            return result
+
+        report = generate_ai_report(
+            findings=result.findings,
+            pillar_scores=result.pillar_scores,
+            overall_score=result.overall_score,
+            account_id=result.account_id,
+            region=result.region,
+        )
+        stamp_remediations(result.findings, report["remediations"])
+        for finding in result.findings:
+            if not finding.remediation_steps:
+                finding.remediation_steps = finding.fallback_remediation
+        result.executive_summary = report["summary"]
+        return result
+
     # ------------------------------------------------------------------
     # Optional: IAM / permission guidance
     # ------------------------------------------------------------------
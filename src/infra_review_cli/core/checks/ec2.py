@@ -4,42 +4,73 @@ EC2 checks — consolidated rightsizing, unattached EBS, unassociated EIPs, and
 
 from datetime import datetime, timezone
 from infra_review_cli.core.ai.ec2 import suggest_ec2_rightsizing
+from infra_review_cli.core.ai.llm_client import ai_executor
 from infra_review_cli.core.models import Finding, Severity, Effort, Pillar
 from infra_review_cli.utils.pricing import get_ebs_price_per_gb, get_elastic_ip_price
 from infra_review_cli.utils.utility import generate_finding_id
 from infra_review_cli.config import CPU_OVERUTIL_THRESHOLD, CPU_PEAK_SPIKE_THRESHOLD
 
 
+def _suggest_rightsizing(inst: dict) -> dict:
+    return suggest_ec2_rightsizing(
+        instance_id=inst["instance_id"],
+        instance_type=inst["instance_type"],
+        architecture=inst.get("architecture", "x86_64"),
+        region=inst["region"],
+        current_price=inst.get("current_price", 0.0),
+        cpu_avg=inst["cpu_avg"],
+        cpu_max=inst["cpu_max"],
+        network_gb_total=inst.get("network_gb_total", 0.0)
+    )
+
+
+def _suggest_rightsizing_all(instance_data: list, indices: list[int]) -> list[dict]:
+    """AI rightsizing suggestions for instance_data[k] for each k, in order."""
+    instances = [instance_data[k] for k in indices]
+    if len(instances) < 2:
+        return [_suggest_rightsizing(inst) for inst in instances]
+
+    return list(ai_executor().map(_suggest_rightsizing, instances))
+
+
 def check_ec2_rightsizing(instance_data: list, threshold: float = 20.0) -> list[Finding]:
     findings = []
-    for inst in instance_data:
+    append = findings.append
+
+    # Classify on the CPU columns first; the (usually many) healthy instances
+    # never reach the per-instance field reads below. Input order is kept.
+    cpu_avgs = [inst["cpu_avg"] for inst in instance_data]
+    cpu_maxes = [inst["cpu_max"] for inst in instance_data]
+    busy_avg = CPU_OVERUTIL_THRESHOLD * 0.7
+    flagged = [
+        k for k, (cpu_avg, cpu_max) in enumerate(zip(cpu_avgs, cpu_maxes))
+        if cpu_avg < threshold
+        or cpu_avg > CPU_OVERUTIL_THRESHOLD
+        or (cpu_max > CPU_PEAK_SPIKE_THRESHOLD and cpu_avg > busy_avg)
+    ]
+
+    # The AI suggestions are blocking network calls: issue them all up front on the
+    # shared AI pool (at most AI_MAX_CONCURRENCY in flight) instead of one per iteration
+    underutilized = [k for k in flagged if cpu_avgs[k] < threshold]
+    suggestions = dict(zip(underutilized, _suggest_rightsizing_all(instance_data, underutilized)))
+
+    for k in flagged:
+        inst = instance_data[k]
         instance_id = inst["instance_id"]
-        cpu_avg = inst["cpu_avg"]
-        cpu_max = inst["cpu_max"]
-        instance_type = inst["instance_type"]
+        cpu_avg = cpu_avgs[k]
+        cpu_max = cpu_maxes[k]
         region = inst["region"]
-        arch = inst.get("architecture", "x86_64")
-        network = inst.get("network_gb_total", 0.0)
         price = inst.get("current_price", 0.0)
 
         if cpu_avg < threshold:
-            suggestion = suggest_ec2_rightsizing(
-                instance_id=instance_id,
-                instance_type=instance_type,
-                architecture=arch,
-                region=region,
-                current_price=price,
-                cpu_avg=cpu_avg,
-                cpu_max=cpu_max,
-                network_gb_total=network
-            )
+            suggestion = suggestions[k]
 
             if suggestion and suggestion.get("suggested_instance_type"):
                 est_savings = suggestion.get("estimated_monthly_savings")
                 if est_savings is None:
                     est_savings = price * 730 * 0.5 if price > 0 else 0.0
 
-                findings.append(Finding(
+                append(Finding(
                     finding_id=generate_finding_id("cost-ec2-001", instance_id, region),
                     resource_id=instance_id,
                     region=region,
@@ -56,8 +87,8 @@ def check_ec2_rightsizing(instance_data: list, threshold: float = 20.0) -> list[
                     remediation_steps=suggestion.get("notes", "Review before resizing.")
                 ))
 
-        elif cpu_avg > CPU_OVERUTIL_THRESHOLD or (cpu_max > CPU_PEAK_SPIKE_THRESHOLD and cpu_avg > (CPU_OVERUTIL_THRESHOLD * 0.7)):
-            findings.append(Finding(
+        else:  # overutilized, per the filter above
+            append(Finding(
                 finding_id=generate_finding_id("perf-ec2-highcpu", instance_id, region),
                 resource_id=instance_id,
                 region=region,
@@ -78,6 +109,7 @@ def check_ec2_rightsizing(instance_data: list, threshold: float = 20.0) -> list[
 def check_unattached_ebs(volumes: list[dict], region: str, min_age_days: int = 30) -> list[Finding]:
     now = datetime.now(timezone.utc)
     findings = []
+    append = findings.append
     for vol in volumes:
         size_gb = vol["Size"]
         if vol["State"] != "available":
@@ -92,7 +124,7 @@ def check_unattached_ebs(volumes: list[dict], region: str, min_age_days: int = 3
         estimated_savings = size_gb * price_per_gb
 
         resource_id = vol["VolumeId"]
-        findings.append(Finding(
+        append(Finding(
             finding_id=generate_finding_id("cost-ebs-001", resource_id, region),
             resource_id=resource_id,
             region=region,
@@ -112,12 +144,13 @@ def check_unattached_ebs(volumes: list[dict], region: str, min_age_days: int = 3
 
 def check_unassociated_elastic_ips(addresses: list[dict], region: str) -> list[Finding]:
     findings = []
+    append = findings.append
     for ip in addresses:
         if "AssociationId" not in ip:
             allocation_id = ip.get("AllocationId", "unknown")
             public_ip = ip.get("PublicIp", "unknown")
 
-            findings.append(Finding(
+            append(Finding(
                 finding_id=generate_finding_id("cost-elip-003", allocation_id, region),
                 resource_id=public_ip,
                 region=region,
@@ -141,11 +174,12 @@ def check_ec2_autoscaling_groups(
 ) -> list[Finding]:
     """Flags running EC2 instances that are NOT part of any Auto Scaling Group."""
     findings = []
+    append = findings.append
     for instance_id in all_instance_ids:
         if instance_id in instance_ids_in_asgs:
             continue
 
-        findings.append(Finding(
+        append(Finding(
             finding_id=generate_finding_id("rel-asg-001", instance_id, region),
             resource_id=instance_id,
             region=region,
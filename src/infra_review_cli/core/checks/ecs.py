@@ -3,20 +3,31 @@ ECS checks — consolidated security, scaling, drift, and performance.
 """
 
 from infra_review_cli.core.ai.fargate import suggest_cpu_memory
+from infra_review_cli.core.ai.remediation import resolve_remediations
 from infra_review_cli.core.models import Finding, Pillar, Severity, Effort
-from infra_review_cli.core.ai.remediation import generate_ai_remediation
 from infra_review_cli.utils.utility import generate_finding_id
 
 
-def check_ecs_task_definition_drift(service_name, current_rev, latest_rev, region):
+# Used when no AI provider produced steps, so a drift finding is never left blank
+_DRIFT_FALLBACK_STEPS = (
+    "- Review the changes between the running and latest task definition revisions.\n"
+    "- Update the service to the latest revision (aws ecs update-service --task-definition <family>)."
+)
+
+
+def check_ecs_task_definition_drift_deferred(service_name, current_rev, latest_rev, region) -> list[Finding]:
+    """
+    Same finding as check_ecs_task_definition_drift, with remediation_steps left empty
+    for the caller to resolve in bulk (run_scan leaves it to BaseCloudProvider.finalize_scan,
+    which batches every pending finding into one AI round-trip). The static drift steps
+    ride along as fallback_remediation for when the AI produces none.
+    """
     headline = f"ECS service '{service_name}' is not using latest task definition"
     description = (
         f"The service is using revision {current_rev}, "
         f"but the latest available is {latest_rev}."
     )
 
-    remediation = generate_ai_remediation(headline, description)
-
     return [Finding(
         finding_id=generate_finding_id("perf-ecs-001", service_name, region),
         resource_id=service_name,
@@ -26,10 +37,20 @@ def check_ecs_task_definition_drift(service_name, current_rev, latest_rev, regio
         effort=Effort.MEDIUM,
         headline=headline,
         detailed_description=description,
-        remediation_steps=remediation
+        fallback_remediation=_DRIFT_FALLBACK_STEPS,
     )]
 
 
+def check_ecs_task_definition_drift(service_name, current_rev, latest_rev, region) -> list[Finding]:
+    findings = resolve_remediations(
+        check_ecs_task_definition_drift_deferred(service_name, current_rev, latest_rev, region)
+    )
+    for finding in findings:
+        if not finding.remediation_steps:
+            finding.remediation_steps = finding.fallback_remediation
+    return findings
+
+
 def check_unused_services(service: dict, cluster_arn: str, region: str) -> list[Finding]:
     service_name = service["serviceName"]
     desired = service.get("desiredCount", 0)
@@ -76,13 +97,16 @@ def check_overprovisioned_task(task_id, service_name, region,
         )
 
         if suggestion and isinstance(suggestion, dict):
-            suggested_cpu = suggestion.get("cpu", requested_cpu)
-            suggested_mem = suggestion.get("memory", requested_mem)
-            est_savings = suggestion.get("estimated_savings", 0.0)
-
-            if suggested_cpu == requested_cpu and suggested_mem == requested_mem:
+            suggested = (
+                suggestion.get("cpu", requested_cpu),
+                suggestion.get("memory", requested_mem),
+            )
+            if suggested == (requested_cpu, requested_mem):
                 return findings
 
+            suggested_cpu, suggested_mem = suggested
+            est_savings = suggestion.get("estimated_savings", 0.0)
+
             headline = f"ECS task '{task_id}' is overprovisioned"
             description = (
                 f"Provisioned: {requested_cpu} CPU, {requested_mem}MB memory. "
@@ -138,6 +162,10 @@ def check_missing_autoscaling(
     )]
 
 
+# An unset user defaults to root inside the container
+_ROOT_USERS = frozenset({"", "root", "0"})
+
+
 def check_task_running_as_root(
     task_arn: str,
     region: str,
@@ -145,12 +173,12 @@ def check_task_running_as_root(
     task_family: str,
 ) -> list[Finding]:
     """Returns a finding if the container user is root or unset."""
-    container_name = container_def.get("name", "unknown")
     user = container_def.get("user", "").strip().lower()
-
-    if user and user not in ["root", "0"]:
+    if user not in _ROOT_USERS:
         return []
 
+    container_name = container_def.get("name", "unknown")
+
     headline = f"ECS container '{container_name}' runs as root"
     description = (
         f"The container in task definition '{task_family}' is either not specifying a user "
@@ -1,5 +1,4 @@
-from infra_review_cli.core.ai.cost import estimate_savings
-from infra_review_cli.core.ai.remediation import generate_ai_remediation
+from infra_review_cli.core.ai.cost import estimate_savings_bulk
 from infra_review_cli.core.models import Finding, Severity, Effort, Pillar
 from infra_review_cli.utils.utility import generate_finding_id
 
@@ -16,42 +15,36 @@ def check_unused_elb(elbs: list[dict], region: str) -> list[Finding]:
       - HealthyTargetCount
     """
     findings = []
+    append = findings.append
 
+    # Collect unused ELBs first so savings are estimated in one bulk call
+    unused = [
+        elb for elb in elbs
+        if elb.get("RequestCount", 0) == 0 and elb.get("HealthyTargetCount", 0) == 0
+    ]
+    savings = estimate_savings_bulk([("elb", "unused_elb", region)] * len(unused))
 
-
-    for elb in elbs:
+    for elb, estimated_savings in zip(unused, savings):
+        name = elb.get("Name")
+        lb_type = elb.get("Type")
 
         headline = "Unused Load Balancer detected"
         detailed_description = (
-            f"Load Balancer '{elb.get("Name")}' of type '{elb.get("Type")}' has had no traffic and "
+            f"Load Balancer '{name}' of type '{lb_type}' has had no traffic and "
             f"no healthy targets in the past 7 days. It may be unused."
         )
 
-        # remediation_steps = generate_ai_remediation(headline, detailed_description)
-
-        name = elb.get("Name")
-        lb_type = elb.get("Type")
-        arn = elb.get("LoadBalancerArn", name)
-        request_count = elb.get("RequestCount", 0)
-        healthy_targets = elb.get("HealthyTargetCount", 0)
-
-        if request_count == 0 and healthy_targets == 0:
-            findings.append(Finding(
-                finding_id=generate_finding_id("cost-elb-001", name, region),
-                resource_id=name,
-                region=region,
-                pillar=Pillar.COST,
-                severity=Severity.MEDIUM,
-                effort=Effort.MEDIUM,
-                headline=headline,
-                estimated_savings=estimate_savings(
-                    resource_type="elb",
-                    usage="unused_elb",
-                    region=region,
-                    instance_id=name
-                ),
-                detailed_description=detailed_description,
-                remediation_steps="Deregister the ELB or update target group health checks."
-            ))
+        append(Finding(
+            finding_id=generate_finding_id("cost-elb-001", name, region),
+            resource_id=name,
+            region=region,
+            pillar=Pillar.COST,
+            severity=Severity.MEDIUM,
+            effort=Effort.MEDIUM,
+            headline=headline,
+            estimated_savings=estimated_savings,
+            detailed_description=detailed_description,
+            remediation_steps="Deregister the ELB or update target group health checks."
+        ))
 
     return findings
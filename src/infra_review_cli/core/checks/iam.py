@@ -8,7 +8,9 @@ Checks in this module:
   - check_public_s3_acl     (sec-s3-002): S3 public ACLs (supplemental)
 """
 
+from collections.abc import Iterable
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache, partial
 from infra_review_cli.core.models import Finding, Pillar, Severity, Effort
 from infra_review_cli.utils.utility import generate_finding_id
 
@@ -17,12 +19,25 @@ from infra_review_cli.utils.utility import generate_finding_id
 # 1. IAM MFA Enabled
 # ---------------------------------------------------------------------------
 
-def check_iam_mfa(users: list[dict], region: str = "global") -> list[Finding]:
+_MFA_HEADLINE = "IAM user '%s' does not have MFA enabled"
+_MFA_DESCRIPTION = (
+    "IAM user '%s' has console access but no MFA device configured. "
+    "If this account's password is compromised, an attacker has unrestricted "
+    "console access to your AWS environment without a second factor."
+)
+_MFA_REMEDIATION = (
+    "- Require the user to set up an MFA device: "
+    "AWS Console > IAM > Users > %s > Security credentials > MFA.\n"
+    "- Enforce MFA via an IAM policy condition: "
+    "aws:MultiFactorAuthPresent: 'true'."
+)
+
+def check_iam_mfa(users: Iterable[dict], region: str = "global") -> list[Finding]:
     """
     Flags IAM users that do not have MFA enabled.
 
     Args:
-        users: List of user dicts. Each should include:
+        users: Iterable of user dicts (consumed once). Each should include:
                - UserName (str)
                - UserId (str)
                - MFADevices (list) — empty = no MFA
@@ -32,43 +47,33 @@ def check_iam_mfa(users: list[dict], region: str = "global") -> list[Finding]:
     IAM required: iam:ListUsers, iam:ListMFADevices
     """
     findings = []
+    append = findings.append
+    make_finding = partial(
+        Finding,
+        region=region,
+        pillar=Pillar.SECURITY,
+        severity=Severity.CRITICAL,
+        effort=Effort.LOW,
+        required_iam_permission="iam:ListMFADevices",
+    )
 
     for user in users:
-        username = user.get("UserName", "unknown")
-        mfa_devices = user.get("MFADevices", [])
-        has_console_password = user.get("PasswordLastUsed") is not None
+        # Common case first: users with an MFA device never produce a finding
+        if user.get("MFADevices"):
+            continue
 
         # Only flag users with console access (no point flagging service accounts
         # that never log in — they use access keys not passwords)
-        if not has_console_password and not user.get("ConsoleAccess", True):
-            continue
-
-        if mfa_devices:
+        if user.get("PasswordLastUsed") is None and not user.get("ConsoleAccess", True):
             continue
 
-        headline = f"IAM user '{username}' does not have MFA enabled"
-        description = (
-            f"IAM user '{username}' has console access but no MFA device configured. "
-            "If this account's password is compromised, an attacker has unrestricted "
-            "console access to your AWS environment without a second factor."
-        )
-
-        findings.append(Finding(
+        username = user.get("UserName", "unknown")
+        append(make_finding(
             finding_id=generate_finding_id("sec-iam-001", username, region),
             resource_id=username,
-            region=region,
-            pillar=Pillar.SECURITY,
-            severity=Severity.CRITICAL,
-            effort=Effort.LOW,
-            headline=headline,
-            detailed_description=description,
-            remediation_steps=(
-                f"- Require the user to set up an MFA device: "
-                f"AWS Console > IAM > Users > {username} > Security credentials > MFA.\n"
-                "- Enforce MFA via an IAM policy condition: "
-                "aws:MultiFactorAuthPresent: 'true'."
-            ),
-            required_iam_permission="iam:ListMFADevices",
+            headline=_MFA_HEADLINE % username,
+            detailed_description=_MFA_DESCRIPTION % username,
+            remediation_steps=_MFA_REMEDIATION % username,
         ))
 
     return findings
@@ -78,6 +83,15 @@ def check_iam_mfa(users: list[dict], region: str = "global") -> list[Finding]:
 # 2. Root Account Activity
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime | None:
+    """Parse a credential-report timestamp; memoised since re-scans see the same strings."""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+
+
 def check_root_account_activity(
     credential_report_rows: list[dict],
     region: str = "global",
@@ -97,6 +111,7 @@ def check_root_account_activity(
     IAM required: iam:GenerateCredentialReport, iam:GetCredentialReport
     """
     findings = []
+    now = datetime.now(timezone.utc)
 
     for row in credential_report_rows:
         if row.get("user") != "<root_account>":
@@ -106,12 +121,11 @@ def check_root_account_activity(
         if last_used_str in ("N/A", "no_information", "not_supported", ""):
             continue
 
-        try:
-            last_used = datetime.fromisoformat(last_used_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
+        last_used = _parse_iso(last_used_str)
+        if last_used is None:
             continue
 
-        days_ago = (datetime.now(timezone.utc) - last_used).days
+        days_ago = (now - last_used).days
 
         if days_ago <= lookback_days:
             headline = f"Root account was used {days_ago} day(s) ago"
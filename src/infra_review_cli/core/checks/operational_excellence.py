@@ -12,6 +12,10 @@ Checks in this module:
   - check_secrets_in_lambda_env  (ops-ssm-001): Are secrets stored in Lambda env vars?
 """
 
+import re
+from collections.abc import Iterable
+from functools import partial
+
 from infra_review_cli.core.models import Finding, Pillar, Severity, Effort
 from infra_review_cli.utils.utility import generate_finding_id
 
@@ -35,9 +39,7 @@ def check_cloudtrail_enabled(trails: list[dict], region: str) -> list[Finding]:
 
     IAM required: cloudtrail:DescribeTrails, cloudtrail:GetTrailStatus
     """
-    active_trails = [t for t in trails if t.get("IsLogging", False)]
-
-    if active_trails:
+    if any(t.get("IsLogging", False) for t in trails):
         return []
 
     headline = "CloudTrail is not enabled or logging is paused"
@@ -113,8 +115,20 @@ def check_cloudwatch_alarms(alarms: list[dict], region: str) -> list[Finding]:
 # 3. Resource Tagging
 # ---------------------------------------------------------------------------
 
+# Text templates parsed once at import; filled per resource with % formatting
+_TAG_HEADLINE = "Resource is missing required tags: %s"
+_TAG_DESCRIPTION = (
+    "Resource '%s' is missing the following required tags: %s. "
+    "Untagged resources cannot be attributed to a team, environment, or cost center, "
+    "making cost allocation and incident response much harder."
+)
+_TAG_REMEDIATION = (
+    "- Add the missing tags (%s) to resource '%s'.\n"
+    "- Enforce tagging via AWS Config rule 'required-tags' or a Service Control Policy."
+)
+
 def check_resource_tagging(
-    resources: list[dict],
+    resources: Iterable[dict],
     required_tags: list[str],
     region: str,
 ) -> list[Finding]:
@@ -122,7 +136,7 @@ def check_resource_tagging(
     Checks whether AWS resources have the required tags.
 
     Args:
-        resources: List of resource dicts. Each dict must have:
+        resources: Iterable of resource dicts (consumed once). Each dict must have:
                    - ResourceARN (str)
                    - Tags (list of {"Key": str, "Value": str})
         required_tags: List of tag keys that must be present (e.g. ["Name","Environment","Owner"]).
@@ -131,36 +145,33 @@ def check_resource_tagging(
     IAM required: tag:GetResources
     """
     findings = []
+    append = findings.append
+    required_set = frozenset(required_tags)
+    make_finding = partial(
+        Finding,
+        region=region,
+        pillar=Pillar.OPERATIONAL,
+        severity=Severity.MEDIUM,
+        effort=Effort.LOW,
+        required_iam_permission="tag:GetResources",
+    )
 
     for resource in resources:
         arn = resource.get("ResourceARN", "unknown")
-        existing_keys = {tag["Key"] for tag in resource.get("Tags", [])}
-        missing = [t for t in required_tags if t not in existing_keys]
-
-        if not missing:
+        existing_keys = {tag["Key"] for tag in resource.get("Tags", ())}
+        missing_set = required_set - existing_keys
+        if not missing_set:
             continue
 
-        headline = f"Resource is missing required tags: {', '.join(missing)}"
-        description = (
-            f"Resource '{arn}' is missing the following required tags: {', '.join(missing)}. "
-            "Untagged resources cannot be attributed to a team, environment, or cost center, "
-            "making cost allocation and incident response much harder."
-        )
+        # Keep the configured tag order so reports stay stable between runs
+        missing_str = ", ".join(t for t in required_tags if t in missing_set)
 
-        findings.append(Finding(
+        append(make_finding(
             finding_id=generate_finding_id("ops-tag-001", arn, region),
             resource_id=arn,
-            region=region,
-            pillar=Pillar.OPERATIONAL,
-            severity=Severity.MEDIUM,
-            effort=Effort.LOW,
-            headline=headline,
-            detailed_description=description,
-            remediation_steps=(
-                f"- Add the missing tags ({', '.join(missing)}) to resource '{arn}'.\n"
-                "- Enforce tagging via AWS Config rule 'required-tags' or a Service Control Policy."
-            ),
-            required_iam_permission="tag:GetResources",
+            headline=_TAG_HEADLINE % missing_str,
+            detailed_description=_TAG_DESCRIPTION % (arn, missing_str),
+            remediation_steps=_TAG_REMEDIATION % (missing_str, arn),
         ))
 
     return findings
@@ -176,14 +187,26 @@ _SECRET_PATTERNS = [
     "db_pass", "database_password", "auth_token",
 ]
 
+# One case-insensitive alternation: a single C-level scan per key instead of
+# a Python-level substring test for every pattern. Patterns that contain another
+# pattern (e.g. "database_password" ⊃ "password") can never change the result,
+# so they are dropped to keep the alternation as small as possible.
+_SECRET_RE = re.compile(
+    "|".join(
+        re.escape(p) for p in _SECRET_PATTERNS
+        if not any(q != p and q in p for q in _SECRET_PATTERNS)
+    ),
+    re.IGNORECASE,
+)
+
 
-def check_secrets_in_lambda_env(functions: list[dict], region: str) -> list[Finding]:
+def check_secrets_in_lambda_env(functions: Iterable[dict], region: str) -> list[Finding]:
     """
     Checks Lambda function environment variables for keys that suggest
     hardcoded secrets (vs. using AWS Secrets Manager or SSM Parameter Store).
 
     Args:
-        functions: List of function dicts from lambda.list_functions()["Functions"].
+        functions: Iterable of function dicts from lambda.list_functions()["Functions"].
                    Each dict should include:
                    - FunctionName (str)
                    - Environment.Variables (dict, optional)
@@ -192,6 +215,20 @@ def check_secrets_in_lambda_env(functions: list[dict], region: str) -> list[Find
     IAM required: lambda:ListFunctions, lambda:GetFunctionConfiguration
     """
     findings = []
+    append = findings.append
+    make_finding = partial(
+        Finding,
+        region=region,
+        pillar=Pillar.OPERATIONAL,
+        severity=Severity.HIGH,
+        effort=Effort.MEDIUM,
+        remediation_steps=(
+            "- Migrate secret values to AWS Secrets Manager or SSM Parameter Store.\n"
+            "- Reference them in Lambda using the /aws/reference/secretsmanager/ "
+            "environment variable syntax or fetch programmatically at runtime."
+        ),
+        required_iam_permission="lambda:ListFunctions",
+    )
 
     for fn in functions:
         fn_name = fn.get("FunctionName", "unknown")
@@ -199,10 +236,7 @@ def check_secrets_in_lambda_env(functions: list[dict], region: str) -> list[Find
         if not env_vars:
             continue
 
-        suspicious = [
-            key for key in env_vars
-            if any(pattern in key.lower() for pattern in _SECRET_PATTERNS)
-        ]
+        suspicious = [key for key in env_vars if _SECRET_RE.search(key)]
 
         if not suspicious:
             continue
@@ -215,21 +249,11 @@ def check_secrets_in_lambda_env(functions: list[dict], region: str) -> list[Find
             "IAM policies, and AWS Console sessions."
         )
 
-        findings.append(Finding(
+        append(make_finding(
             finding_id=generate_finding_id("ops-ssm-001", fn_name, region),
             resource_id=fn_name,
-            region=region,
-            pillar=Pillar.OPERATIONAL,
-            severity=Severity.HIGH,
-            effort=Effort.MEDIUM,
             headline=headline,
             detailed_description=description,
-            remediation_steps=(
-                "- Migrate secret values to AWS Secrets Manager or SSM Parameter Store.\n"
-                "- Reference them in Lambda using the /aws/reference/secretsmanager/ "
-                "environment variable syntax or fetch programmatically at runtime."
-            ),
-            required_iam_permission="lambda:ListFunctions",
         ))
 
     return findings
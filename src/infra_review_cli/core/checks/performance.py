@@ -7,6 +7,10 @@ Checks in this module:
   - check_ec2_rightsizing_extended (perf-ec2-002): High-CPU instances without ASG
 """
 
+import re
+from collections.abc import Iterable
+from functools import partial
+
 from infra_review_cli.core.models import Finding, Pillar, Severity, Effort
 from infra_review_cli.utils.utility import generate_finding_id
 
@@ -15,8 +19,26 @@ from infra_review_cli.utils.utility import generate_finding_id
 # 1. CloudFront Distribution Usage
 # ---------------------------------------------------------------------------
 
+# "<bucket>.s3.amazonaws.com", "<bucket>.s3.<region>.amazonaws.com", "<bucket>.s3-website-...".
+# Anchored on the endpoint suffix (greedy bucket group) so bucket names that
+# themselves contain ".s3." or ".s3-" are captured whole.
+_S3_ORIGIN_RE = re.compile(r"^(.+)\.s3(?:[.-][a-z0-9]+)*\.amazonaws\.com(?:\.cn)?$")
+
+
+def _normalise_origin(domain: str) -> str:
+    """
+    Canonical form of an origin/ALB domain for exact matching: lower-case, no
+    scheme, trailing slash or root-label dot, and no "dualstack." prefix (CloudFront
+    origins often use the dual-stack alias of an ALB's DNS name).
+    """
+    domain = domain.strip().lower()
+    if "://" in domain:
+        domain = domain.split("://", 1)[1]
+    return domain.rstrip("/").rstrip(".").removeprefix("dualstack.")
+
+
 def check_cloudfront_usage(
-    distributions: list[dict],
+    distributions: Iterable[dict],
     public_buckets: list[str],
     alb_dns_names: list[str],
     region: str,
@@ -33,16 +55,29 @@ def check_cloudfront_usage(
     IAM required: cloudfront:ListDistributions
     """
     findings = []
+    append = findings.append
+    make_finding = partial(
+        Finding,
+        region=region,
+        pillar=Pillar.PERFORMANCE,
+        severity=Severity.LOW,
+        effort=Effort.MEDIUM,
+        required_iam_permission="cloudfront:ListDistributions",
+    )
 
-    # Build set of origins already in CloudFront
+    # Normalise every origin once so each bucket/ALB is a single set lookup
     cf_origins: set[str] = set()
+    cf_bucket_names: set[str] = set()
     for dist in distributions:
         for origin in dist.get("Origins", {}).get("Items", []):
-            cf_origins.add(origin.get("DomainName", "").lower())
+            domain = _normalise_origin(origin.get("DomainName", ""))
+            cf_origins.add(domain)
+            match = _S3_ORIGIN_RE.match(domain)
+            if match:
+                cf_bucket_names.add(match.group(1))
 
     for bucket_name in public_buckets:
-        bucket_domain = f"{bucket_name}.s3.amazonaws.com"
-        if any(bucket_name in o or bucket_domain in o for o in cf_origins):
+        if bucket_name.lower() in cf_bucket_names:
             continue
 
         headline = f"Public S3 bucket '{bucket_name}' is not served via CloudFront"
@@ -52,24 +87,19 @@ def check_cloudfront_usage(
             "served directly from S3 with higher latency, no edge caching, no WAF "
             "integration, and no custom SSL certificate support."
         )
-        findings.append(Finding(
+        append(make_finding(
             finding_id=generate_finding_id("perf-cf-001", bucket_name, region),
             resource_id=bucket_name,
-            region=region,
-            pillar=Pillar.PERFORMANCE,
-            severity=Severity.LOW,
-            effort=Effort.MEDIUM,
             headline=headline,
             detailed_description=description,
             remediation_steps=(
                 f"- Create a CloudFront distribution with origin: {bucket_name}.s3.amazonaws.com\n"
                 "- Enable Origin Access Control (OAC) so S3 only serves content via CloudFront."
             ),
-            required_iam_permission="cloudfront:ListDistributions",
         ))
 
     for alb_dns in alb_dns_names:
-        if any(alb_dns.lower() in o for o in cf_origins):
+        if _normalise_origin(alb_dns) in cf_origins:
             continue
 
         headline = f"ALB '{alb_dns}' is not behind a CloudFront distribution"
@@ -78,13 +108,9 @@ def check_cloudfront_usage(
             "in front of it. CloudFront would reduce latency for global users via edge "
             "caching of static assets and enable AWS WAF for additional security."
         )
-        findings.append(Finding(
+        append(make_finding(
             finding_id=generate_finding_id("perf-cf-002", alb_dns, region),
             resource_id=alb_dns,
-            region=region,
-            pillar=Pillar.PERFORMANCE,
-            severity=Severity.LOW,
-            effort=Effort.MEDIUM,
             headline=headline,
             detailed_description=description,
             remediation_steps=(
@@ -92,7 +118,6 @@ def check_cloudfront_usage(
                 "- Configure caching behaviors for static assets (images, CSS, JS) "
                 "and pass dynamic requests to the origin."
             ),
-            required_iam_permission="cloudfront:ListDistributions",
         ))
 
     return findings
@@ -7,36 +7,55 @@ from infra_review_cli.utils.utility import generate_finding_id
 from infra_review_cli.config import RDS_MIN_BACKUP_RETENTION_DAYS
 
 
+# Finding text templates, filled per instance with str.format_map
+_MULTI_AZ_HEADLINE = "RDS instance '{db_id}' is not running in Multi-AZ"
+_MULTI_AZ_DESCRIPTION = (
+    "RDS instance '{db_id}' ({engine}, {instance_class}) is configured as a single-AZ deployment. "
+    "A failure in the underlying hardware or AZ will cause downtime."
+)
+_MULTI_AZ_REMEDIATION = (
+    "Modify the DB instance and enable Multi-AZ: "
+    "aws rds modify-db-instance --db-instance-identifier {db_id} --multi-az --apply-immediately"
+)
+
+_BACKUP_HEADLINE = "RDS instance '{db_id}' has insufficient backup retention ({retention} day(s))"
+_BACKUP_DESCRIPTION = (
+    "Automated backups are configured for only {retention} day(s). "
+    "Minimum recommended is {minimum} days."
+)
+_BACKUP_REMEDIATION = (
+    "Set backup retention to {minimum} days: "
+    "aws rds modify-db-instance --db-instance-identifier {db_id} --backup-retention-period {minimum}"
+)
+
+
 def check_rds_multi_az(instances: list[dict], region: str) -> list[Finding]:
     """Flags RDS DB instances not running in Multi-AZ mode."""
-    findings = []
-    for inst in instances:
-        if inst.get("MultiAZ", False):
-            continue
-
-        db_id = inst.get("DBInstanceIdentifier", "unknown")
-        engine = inst.get("Engine", "unknown")
-        instance_class = inst.get("DBInstanceClass", "unknown")
+    # Filter on a single column first; only flagged instances pay for the other lookups
+    multi_az = [inst.get("MultiAZ", False) for inst in instances]
+    flagged = [k for k, enabled in enumerate(multi_az) if not enabled]
 
-        headline = f"RDS instance '{db_id}' is not running in Multi-AZ"
-        description = (
-            f"RDS instance '{db_id}' ({engine}, {instance_class}) is configured as a single-AZ deployment. "
-            "A failure in the underlying hardware or AZ will cause downtime."
-        )
+    findings = []
+    append = findings.append
+    for k in flagged:
+        inst = instances[k]
+        fields = {
+            "db_id": inst.get("DBInstanceIdentifier", "unknown"),
+            "engine": inst.get("Engine", "unknown"),
+            "instance_class": inst.get("DBInstanceClass", "unknown"),
+        }
+        db_id = fields["db_id"]
 
-        findings.append(Finding(
+        append(Finding(
             finding_id=generate_finding_id("rel-rds-001", db_id, region),
             resource_id=db_id,
             region=region,
             pillar=Pillar.RELIABILITY,
             severity=Severity.HIGH,
             effort=Effort.LOW,
-            headline=headline,
-            detailed_description=description,
-            remediation_steps=(
-                f"Modify the DB instance and enable Multi-AZ: "
-                f"aws rds modify-db-instance --db-instance-identifier {db_id} --multi-az --apply-immediately"
-            ),
+            headline=_MULTI_AZ_HEADLINE.format_map(fields),
+            detailed_description=_MULTI_AZ_DESCRIPTION.format_map(fields),
+            remediation_steps=_MULTI_AZ_REMEDIATION.format_map(fields),
             required_iam_permission="rds:DescribeDBInstances",
         ))
     return findings
@@ -44,34 +63,31 @@ def check_rds_multi_az(instances: list[dict], region: str) -> list[Finding]:
 
 def check_rds_backup_policy(instances: list[dict], region: str) -> list[Finding]:
     """Flags RDS instances with insufficient automated backup retention."""
-    findings = []
-    for inst in instances:
-        db_id = inst.get("DBInstanceIdentifier", "unknown")
-        retention = inst.get("BackupRetentionPeriod", 0)
+    retentions = [inst.get("BackupRetentionPeriod", 0) for inst in instances]
+    flagged = [k for k, retention in enumerate(retentions) if retention < RDS_MIN_BACKUP_RETENTION_DAYS]
 
-        if retention >= RDS_MIN_BACKUP_RETENTION_DAYS:
-            continue
-
-        headline = f"RDS instance '{db_id}' has insufficient backup retention ({retention} day(s))"
-        description = (
-            f"Automated backups are configured for only {retention} day(s). "
-            f"Minimum recommended is {RDS_MIN_BACKUP_RETENTION_DAYS} days."
-        )
+    findings = []
+    append = findings.append
+    for k in flagged:
+        retention = retentions[k]
+        fields = {
+            "db_id": instances[k].get("DBInstanceIdentifier", "unknown"),
+            "retention": retention,
+            "minimum": RDS_MIN_BACKUP_RETENTION_DAYS,
+        }
+        db_id = fields["db_id"]
         sev = Severity.CRITICAL if retention == 0 else Severity.HIGH
 
-        findings.append(Finding(
+        append(Finding(
             finding_id=generate_finding_id("rel-rds-002", db_id, region),
             resource_id=db_id,
             region=region,
             pillar=Pillar.RELIABILITY,
             severity=sev,
             effort=Effort.LOW,
-            headline=headline,
-            detailed_description=description,
-            remediation_steps=(
-                f"Set backup retention to {RDS_MIN_BACKUP_RETENTION_DAYS} days: "
-                f"aws rds modify-db-instance --db-instance-identifier {db_id} --backup-retention-period {RDS_MIN_BACKUP_RETENTION_DAYS}"
-            ),
+            headline=_BACKUP_HEADLINE.format_map(fields),
+            detailed_description=_BACKUP_DESCRIPTION.format_map(fields),
+            remediation_steps=_BACKUP_REMEDIATION.format_map(fields),
             required_iam_permission="rds:DescribeDBInstances",
         ))
     return findings
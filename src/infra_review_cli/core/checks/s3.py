@@ -9,13 +9,14 @@ from infra_review_cli.utils.utility import generate_finding_id
 def check_s3_public_access(s3_buckets: list[dict], region: str) -> list[Finding]:
     """Flags S3 buckets that are publicly accessible."""
     findings = []
+    append = findings.append
     for bucket in s3_buckets:
         if bucket.get("Public", False):
             name = bucket["Name"]
             headline = "S3 bucket is publicly accessible"
             description = f"Bucket '{name}' is publicly accessible. Reason: {bucket.get('Reason', 'Unknown')}"
 
-            findings.append(Finding(
+            append(Finding(
                 finding_id=generate_finding_id("sec-s3-001", name, region),
                 resource_id=name,
                 region=region,
@@ -30,25 +31,31 @@ def check_s3_public_access(s3_buckets: list[dict], region: str) -> list[Finding]
     return findings
 
 
+# Indexed by `status == "Suspended"`: (severity, state, what happened)
+_VERSIONING_STATES = (
+    (Severity.MEDIUM, "disabled", "has never had versioning enabled"),
+    (Severity.HIGH, "suspended", "had versioning suspended"),
+)
+
+
 def check_s3_versioning(buckets: list[dict], region: str) -> list[Finding]:
     """Flags S3 buckets that do not have versioning enabled."""
     findings = []
+    append = findings.append
     for bucket in buckets:
-        name = bucket.get("Name", "unknown")
+        # Compliant buckets are skipped before any text is built
         status = bucket.get("VersioningStatus", "")
-
         if status == "Enabled":
             continue
-
-        suspended = status == "Suspended"
-        headline = f"S3 bucket '{name}' has versioning {'suspended' if suspended else 'disabled'}"
+        name = bucket.get("Name", "unknown")
+        sev, state, history = _VERSIONING_STATES[status == "Suspended"]
+        headline = f"S3 bucket '{name}' has versioning {state}"
         description = (
-            f"Bucket '{name}' {'had versioning suspended' if suspended else 'has never had versioning enabled'}. "
+            f"Bucket '{name}' {history}. "
             "Without versioning, accidental deletions or overwrites are permanent."
         )
-        sev = Severity.MEDIUM if not suspended else Severity.HIGH
 
-        findings.append(Finding(
+        append(Finding(
             finding_id=generate_finding_id("rel-s3-001", name, region),
             resource_id=name,
             region=region,
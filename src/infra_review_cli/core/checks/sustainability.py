@@ -4,28 +4,30 @@ Sustainability pillar checks.
 
 import math
 import re
+from functools import lru_cache
 from infra_review_cli.core.models import Effort, Finding, Pillar, Severity
 from infra_review_cli.utils.utility import generate_finding_id
 
 
 _GRAVITON_SUPPORTED_PREFIXES = {"t", "m", "c", "r"}
+_FAMILY_RE = re.compile(r"^([a-z]+)(\d+)([a-z0-9-]*)$")
+_HOURS_PER_MONTH = 730
 
 
-def suggest_graviton_equivalent(instance_type: str) -> str | None:
-    """
-    Returns a likely Graviton equivalent instance type for common families,
-    or None when no straightforward mapping is available.
-    """
-    if not instance_type or "." not in instance_type:
-        return None
+def _monthly_savings(instances: list[dict], factor: float) -> list[float]:
+    """Monthly savings (hourly price * 730 * factor) per instance, 0.0 when unpriced."""
+    prices = [float(inst.get("current_price", 0.0) or 0.0) for inst in instances]
+    return [price * _HOURS_PER_MONTH * factor if price > 0 else 0.0 for price in prices]
 
-    family, size = instance_type.split(".", 1)
-    family = family.lower()
 
+@lru_cache(maxsize=64)
+def _graviton_family(family: str) -> str | None:
+    """Graviton family for an x86 family such as 'm5' or 'c6i', or None."""
+    # Already Graviton
     if family.endswith("g"):
         return None
 
-    match = re.match(r"^([a-z]+)(\d+)([a-z0-9-]*)$", family)
+    match = _FAMILY_RE.match(family)
     if not match:
         return None
 
@@ -33,34 +35,44 @@ def suggest_graviton_equivalent(instance_type: str) -> str | None:
     if prefix not in _GRAVITON_SUPPORTED_PREFIXES:
         return None
 
-    generation = int(generation_raw)
-
     if prefix == "t":
-        target_family = "t4g"
-    else:
-        # m/c/r gained Graviton in gen 6. For higher gens, keep same generation.
-        target_family = f"{prefix}{max(generation, 6)}g"
+        return "t4g"
+    # m/c/r gained Graviton in gen 6. For higher gens, keep same generation.
+    return f"{prefix}{max(int(generation_raw), 6)}g"
+
 
-    return f"{target_family}.{size}"
+@lru_cache(maxsize=512)
+def suggest_graviton_equivalent(instance_type: str) -> str | None:
+    """
+    Returns a likely Graviton equivalent instance type for common families,
+    or None when no straightforward mapping is available.
+    """
+    family, dot, size = (instance_type or "").partition(".")
+    if not dot:
+        return None
+
+    # The family universe is small, so its mapping is cached apart from the sizes
+    target_family = _graviton_family(family.lower())
+    return f"{target_family}.{size}" if target_family else None
 
 
 def check_graviton_instance_usage(instances: list[dict], region: str) -> list[Finding]:
     """Flags x86 instance families with practical Graviton equivalents."""
     findings: list[Finding] = []
+    append = findings.append
 
+    candidates = []
     for inst in instances:
+        suggested = suggest_graviton_equivalent(inst.get("instance_type", ""))
+        if suggested:
+            candidates.append((inst, suggested))
+    savings = _monthly_savings([inst for inst, _ in candidates], 0.2)
+
+    for (inst, suggested), est_savings in zip(candidates, savings):
         instance_id = inst.get("instance_id", "unknown")
         instance_type = inst.get("instance_type", "")
-        suggested = suggest_graviton_equivalent(instance_type)
 
-        if not suggested:
-            continue
-
-        price = float(inst.get("current_price", 0.0) or 0.0)
-        monthly_cost = price * 730 if price > 0 else 0.0
-        est_savings = monthly_cost * 0.2 if monthly_cost > 0 else 0.0
-
-        findings.append(Finding(
+        append(Finding(
             finding_id=generate_finding_id("sus-ec2-graviton-001", instance_id, region),
             resource_id=instance_id,
             region=region,
@@ -87,14 +99,15 @@ def check_graviton_instance_usage(instances: list[dict], region: str) -> list[Fi
 def check_s3_lifecycle_policies(buckets: list[dict], region: str) -> list[Finding]:
     """Flags buckets without lifecycle policies."""
     findings: list[Finding] = []
+    append = findings.append
+
+    # Filter on the flag column first, so only unmanaged buckets reach the per-finding work
+    unmanaged = [bucket for bucket in buckets if not bucket.get("HasLifecycleRules", False)]
 
-    for bucket in buckets:
+    for bucket in unmanaged:
         name = bucket.get("Name", "unknown")
-        has_rules = bucket.get("HasLifecycleRules", False)
-        if has_rules:
-            continue
 
-        findings.append(Finding(
+        append(Finding(
             finding_id=generate_finding_id("sus-s3-lifecycle-001", name, region),
             resource_id=name,
             region=region,
@@ -119,20 +132,20 @@ def check_s3_lifecycle_policies(buckets: list[dict], region: str) -> list[Findin
 def check_idle_always_on_instances(instances: list[dict], region: str, threshold: float = 5.0) -> list[Finding]:
     """Flags EC2 instances that run continuously with very low average CPU."""
     findings: list[Finding] = []
+    append = findings.append
 
-    for inst in instances:
+    # Coerce the CPU column once and keep only the (usually few) idle indices
+    cpu = [float(inst.get("cpu_avg", 0.0) or 0.0) for inst in instances]
+    idle = [k for k, cpu_avg in enumerate(cpu) if cpu_avg < threshold]
+    savings = _monthly_savings([instances[k] for k in idle], 0.5)
+
+    for k, est_savings in zip(idle, savings):
+        inst = instances[k]
+        cpu_avg = cpu[k]
         instance_id = inst.get("instance_id", "unknown")
-        cpu_avg = float(inst.get("cpu_avg", 0.0) or 0.0)
         instance_type = inst.get("instance_type", "unknown")
 
-        if cpu_avg >= threshold:
-            continue
-
-        price = float(inst.get("current_price", 0.0) or 0.0)
-        monthly_cost = price * 730 if price > 0 else 0.0
-        est_savings = monthly_cost * 0.5 if monthly_cost > 0 else 0.0
-
-        findings.append(Finding(
+        append(Finding(
             finding_id=generate_finding_id("sus-ec2-idle-001", instance_id, region),
             resource_id=instance_id,
             region=region,
@@ -155,6 +168,7 @@ def check_idle_always_on_instances(instances: list[dict], region: str, threshold
     return findings
 
 
+@lru_cache(maxsize=512)
 def _recommended_lambda_memory(max_used_mb: float) -> int:
     """Returns memory recommendation with 20% headroom and sane floor."""
     target = max(128.0, max_used_mb * 1.2)
@@ -164,21 +178,28 @@ def _recommended_lambda_memory(max_used_mb: float) -> int:
 def check_lambda_overprovisioned_memory(functions: list[dict], region: str) -> list[Finding]:
     """Flags Lambda functions configured with >2x max observed memory usage."""
     findings: list[Finding] = []
-
-    for fn in functions:
-        name = fn.get("FunctionName", "unknown")
-        configured = int(fn.get("ConfiguredMemoryMB", 0) or 0)
-        max_used = float(fn.get("MaxMemoryUsedMB", 0.0) or 0.0)
-
-        if configured <= 0 or max_used <= 0:
-            continue
-
-        if configured <= (max_used * 2):
-            continue
+    append = findings.append
+
+    # Cheapest tests first: unconfigured functions and those without usage data
+    # never reach the float coercion
+    configured_mb = [int(fn.get("ConfiguredMemoryMB", 0) or 0) for fn in functions]
+    candidates = [
+        (k, configured, raw)
+        for k, configured in enumerate(configured_mb)
+        if configured > 0 and (raw := functions[k].get("MaxMemoryUsedMB"))
+    ]
+    flagged = [
+        (k, configured, max_used)
+        for k, configured, raw in candidates
+        if (max_used := float(raw)) > 0 and configured > max_used * 2
+    ]
+
+    for k, configured, max_used in flagged:
+        name = functions[k].get("FunctionName", "unknown")
 
         suggested = _recommended_lambda_memory(max_used)
 
-        findings.append(Finding(
+        append(Finding(
             finding_id=generate_finding_id("sus-lambda-memory-001", name, region),
             resource_id=name,
             region=region,
@@ -203,13 +224,14 @@ def check_lambda_overprovisioned_memory(functions: list[dict], region: str) -> l
 def check_unencrypted_ebs_volumes(volumes: list[dict], region: str) -> list[Finding]:
     """Flags EBS volumes that are not encrypted."""
     findings: list[Finding] = []
+    append = findings.append
 
     for volume in volumes:
         volume_id = volume.get("VolumeId", "unknown")
         if volume.get("Encrypted", False):
             continue
 
-        findings.append(Finding(
+        append(Finding(
             finding_id=generate_finding_id("sus-ebs-encryption-001", volume_id, region),
             resource_id=volume_id,
             region=region,
@@ -1,61 +1,57 @@
 from infra_review_cli.core.models import Finding, Pillar, Severity, Effort
-from infra_review_cli.core.ai.remediation import generate_ai_remediation
 from infra_review_cli.utils.utility import generate_finding_id
 
 
+# Publicly exposed port → (severity, description). -1 means the rule covers all ports.
+# Ports not listed here default to MEDIUM.
+_PORT_SEVERITY: dict[int, tuple[Severity, str]] = {
+    -1: (Severity.HIGH, "all ports"),
+    # Ports we consider critical if exposed publicly: SSH, RDP, MySQL, Postgres
+    22: (Severity.HIGH, "port 22"),
+    3389: (Severity.HIGH, "port 3389"),
+    3306: (Severity.HIGH, "port 3306"),
+    5432: (Severity.HIGH, "port 5432"),
+    # HTTP, HTTPS
+    80: (Severity.LOW, "port 80"),
+    443: (Severity.LOW, "port 443"),
+}
+
+
 def check_insecure_sg_rules(sg: dict, region: str) -> list[Finding]:
     findings = []
+    append = findings.append
 
-    # Ports we consider critical if exposed publicly
-    high_risk_ports = {22, 3389, 3306, 5432}  # SSH, RDP, MySQL, Postgres
-    low_risk_ports = {80, 443}  # HTTP, HTTPS
+    for rule in sg.get("IpPermissions", ()):
+        # Each rule can have multiple CIDR ranges; only public access is flagged
+        public = [r for r in rule.get("IpRanges", ()) if r.get("CidrIp") == "0.0.0.0/0"]
+        if not public:
+            continue
 
-    for rule in sg.get("IpPermissions", []):
         protocol = rule.get("IpProtocol", "any")
         from_port = rule.get("FromPort", -1)  # -1 means all ports
-        to_port = rule.get("ToPort", -1)
-
-        # Each rule can have multiple CIDR ranges
-        for ip_range in rule.get("IpRanges", []):
-            cidr = ip_range.get("CidrIp")
-
-            # Only flag public access
-            if cidr == "0.0.0.0/0":
-                # Determine severity
-                if from_port == -1:
-                    severity = Severity.HIGH
-                    port_desc = "all ports"
-                elif from_port in high_risk_ports:
-                    severity = Severity.HIGH
-                    port_desc = f"port {from_port}"
-                elif from_port in low_risk_ports:
-                    severity = Severity.LOW
-                    port_desc = f"port {from_port}"
-                else:
-                    severity = Severity.MEDIUM
-                    port_desc = f"port {from_port}"
-
-                # Create a finding
-                headline = f"Security group '{sg['GroupId']}' allows public access on {port_desc}"
-                description = (
-                    f"The security group '{sg['GroupId']}' in region {region} allows inbound "
-                    f"traffic from 0.0.0.0/0 on {port_desc} ({protocol}). "
-                    f"This increases the attack surface and should be restricted."
-                )
-
-                # remediation = generate_ai_remediation(headline, description)
-
-                findings.append(Finding(
-                    finding_id=generate_finding_id("sec-vpc-001", sg["GroupId"], region),
-                    resource_id=sg["GroupId"],
-                    region=region,
-                    pillar=Pillar.SECURITY,
-                    severity=severity,
-                    effort=Effort.LOW,
-                    estimated_savings=0.0,
-                    headline=headline,
-                    detailed_description=description,
-                    remediation_steps="	Restrict access to trusted IP ranges."
-                ))
+
+        # Determine severity
+        severity, port_desc = _PORT_SEVERITY.get(from_port) or (Severity.MEDIUM, f"port {from_port}")
+
+        headline = f"Security group '{sg['GroupId']}' allows public access on {port_desc}"
+        description = (
+            f"The security group '{sg['GroupId']}' in region {region} allows inbound "
+            f"traffic from 0.0.0.0/0 on {port_desc} ({protocol}). "
+            f"This increases the attack surface and should be restricted."
+        )
+
+        for _ in public:  # one finding per public range, as before
+            append(Finding(
+                finding_id=generate_finding_id("sec-vpc-001", sg["GroupId"], region),
+                resource_id=sg["GroupId"],
+                region=region,
+                pillar=Pillar.SECURITY,
+                severity=severity,
+                effort=Effort.LOW,
+                estimated_savings=0.0,
+                headline=headline,
+                detailed_description=description,
+                remediation_steps="	Restrict access to trusted IP ranges."
+            ))
 
     return findings
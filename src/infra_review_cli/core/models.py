@@ -4,6 +4,7 @@ Core domain models for Infra Review CLI.
 These models are cloud-provider agnostic.
 """
 
+from collections import defaultdict
 from enum import Enum
 from dataclasses import dataclass, field
 from typing import Optional
@@ -18,17 +19,27 @@ class Severity(str, Enum):
     @property
     def score_weight(self) -> int:
         """Points deducted from a pillar score per finding of this severity."""
-        return {
-            "Critical": 25,
-            "High": 15,
-            "Medium": 8,
-            "Low": 3,
-        }[self.value]
+        return self._weight
 
     @property
     def order(self) -> int:
         """Sort order: lower = more severe."""
-        return {"Critical": 0, "High": 1, "Medium": 2, "Low": 3}[self.value]
+        return self._order
+
+
+# Points deducted per finding, by severity (see core/scoring.py)
+_SEVERITY_WEIGHT: dict[Severity, int] = {
+    Severity.CRITICAL: 25,
+    Severity.HIGH: 15,
+    Severity.MEDIUM: 8,
+    Severity.LOW: 3,
+}
+
+# Stamp weight and sort order onto the members so the properties are plain attribute reads
+for _order, (_member, _weight) in enumerate(_SEVERITY_WEIGHT.items()):
+    _member._weight = _weight
+    _member._order = _order
+del _order, _member, _weight
 
 
 class Effort(str, Enum):
@@ -46,7 +57,28 @@ class Pillar(str, Enum):
     SUSTAINABILITY = "Sustainability"
 
 
-@dataclass
+# Relative importance of each pillar in the overall health score (see core/scoring.py),
+# stamped on the members so scoring reads `pillar.weight` without a dict lookup
+_PILLAR_WEIGHT: dict[Pillar, float] = {
+    Pillar.SECURITY: 2.0,
+    Pillar.RELIABILITY: 2.0,
+    Pillar.OPERATIONAL: 1.5,
+    Pillar.PERFORMANCE: 1.0,
+    Pillar.COST: 1.0,
+    Pillar.SUSTAINABILITY: 1.0,
+}
+for _member, _weight in _PILLAR_WEIGHT.items():
+    _member.weight = _weight
+del _member, _weight
+
+# Lower-cased values (CSS classes, slugs), computed once per member instead of per render
+for _enum in (Severity, Effort, Pillar):
+    for _member in _enum:
+        _member.lower_value = _member.value.lower()
+del _enum, _member
+
+
+@dataclass(slots=True)
 class Finding:
     """
     A single infrastructure finding produced by a check.
@@ -60,6 +92,8 @@ class Finding:
     headline: str
     detailed_description: str = ""
     remediation_steps: str = ""
+    # Check-specific steps used if remediation_steps is still empty after the AI pass
+    fallback_remediation: str = ""
     effort: Effort = Effort.LOW
     estimated_savings: float = 0.0
     suggested_cpu_units: Optional[int] = None
@@ -70,10 +104,19 @@ class Finding:
     provider: str = "aws"
 
 
-@dataclass
+# (minimum score, label, emoji), checked top-down
+_SCORE_BANDS = (
+    (75, "Good", "🟢"),
+    (50, "Needs Attention", "🟡"),
+    (0, "At Risk", "🔴"),
+)
+
+
+@dataclass(slots=True)
 class PillarScore:
     """
     Aggregated health score for a single Well-Architected pillar.
+    `label` and `emoji` are derived from `score` once, at construction.
     """
     pillar: Pillar
     score: float              # 0–100
@@ -83,22 +126,15 @@ class PillarScore:
     high_count: int = 0
     medium_count: int = 0
     low_count: int = 0
+    label: str = field(init=False, compare=False)
+    emoji: str = field(init=False, compare=False)
 
-    @property
-    def label(self) -> str:
-        if self.score >= 75:
-            return "Good"
-        elif self.score >= 50:
-            return "Needs Attention"
-        return "At Risk"
-
-    @property
-    def emoji(self) -> str:
-        if self.score >= 75:
-            return "🟢"
-        elif self.score >= 50:
-            return "🟡"
-        return "🔴"
+    def __post_init__(self):
+        for minimum, label, emoji in _SCORE_BANDS:
+            if self.score >= minimum:
+                break
+        # Negative scores can't happen (scores are clamped), but fall back to the last band
+        self.label, self.emoji = label, emoji
 
 
 @dataclass
@@ -117,22 +153,22 @@ class ScanResult:
     executive_summary: str = ""
     scan_duration_seconds: Optional[float] = None
 
+    # Aggregates are computed on each access rather than cached: `findings` is a
+    # mutable list, so a cached view would go stale after append() or an edit.
     @property
     def total_savings(self) -> float:
         return sum(f.estimated_savings for f in self.findings)
 
+    def _group_by(self, attr: str) -> dict[str, list[Finding]]:
+        result: defaultdict[str, list[Finding]] = defaultdict(list)
+        for f in self.findings:
+            result[getattr(f, attr).value].append(f)
+        return dict(result)
+
     @property
     def findings_by_pillar(self) -> dict[str, list[Finding]]:
-        result: dict[str, list[Finding]] = {}
-        for f in self.findings:
-            key = f.pillar.value
-            result.setdefault(key, []).append(f)
-        return result
+        return self._group_by("pillar")
 
     @property
     def findings_by_severity(self) -> dict[str, list[Finding]]:
-        result: dict[str, list[Finding]] = {}
-        for f in self.findings:
-            key = f.severity.value
-            result.setdefault(key, []).append(f)
-        return result
+        return self._group_by("severity")
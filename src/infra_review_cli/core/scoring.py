@@ -12,7 +12,9 @@ Scoring model:
 Overall health score = weighted average across all scored pillars.
 """
 
-from infra_review_cli.core.models import Finding, Pillar, PillarScore, ScanResult
+from collections import Counter, defaultdict
+
+from infra_review_cli.core.models import Finding, Pillar, PillarScore, ScanResult, Severity, _SEVERITY_WEIGHT
 from infra_review_cli.config import PILLAR_DISPLAY_ORDER
 
 
@@ -26,41 +28,31 @@ def score_pillar(
 
     Args:
         pillar:           The pillar being scored.
-        findings:         All findings for this pillar.
+        findings:         All findings for this pillar (score_all_pillars partitions them).
         total_checks_run: How many distinct checks were executed for this pillar.
                           Used so a clean scan (zero findings) gives 100, not an error.
 
     Returns:
         A PillarScore with a 0–100 score and severity breakdown.
     """
-    score = 100.0
-    critical = high = medium = low = 0
-
-    for f in findings:
-        if f.pillar != pillar:
-            continue
-        deduction = f.severity.score_weight
-        score = max(0.0, score - deduction)
-
-        sev = f.severity.value
-        if sev == "Critical":
-            critical += 1
-        elif sev == "High":
-            high += 1
-        elif sev == "Medium":
-            medium += 1
-        else:
-            low += 1
+    return _score_from_counts(pillar, Counter(f.severity for f in findings), total_checks_run)
+
+
+def _score_from_counts(pillar: Pillar, counts: dict[Severity, int], total_checks_run: int) -> PillarScore:
+    """Build a PillarScore from per-severity finding counts."""
+    # Deductions are all positive, so clamping once at the end is the same as per finding
+    deduction = sum(n * _SEVERITY_WEIGHT[sev] for sev, n in counts.items())
+    score = max(0.0, 100.0 - deduction)
 
     return PillarScore(
         pillar=pillar,
         score=round(score, 1),
         total_checks_run=total_checks_run,
-        findings_count=len(findings),
-        critical_count=critical,
-        high_count=high,
-        medium_count=medium,
-        low_count=low,
+        findings_count=sum(counts.values()),
+        critical_count=counts.get(Severity.CRITICAL, 0),
+        high_count=counts.get(Severity.HIGH, 0),
+        medium_count=counts.get(Severity.MEDIUM, 0),
+        low_count=counts.get(Severity.LOW, 0),
     )
 
 
@@ -79,14 +71,16 @@ def score_all_pillars(
     Returns:
         Dict mapping pillar name (str) → PillarScore.
     """
-    pillar_findings: dict[Pillar, list[Finding]] = {}
-    for f in findings:
-        pillar_findings.setdefault(f.pillar, []).append(f)
+    # One counting pass over every finding, keyed by (pillar, severity);
+    # pillars then only fold their (at most four) severity counts
+    tallies = Counter((f.pillar, f.severity) for f in findings)
+    counts_by_pillar: defaultdict[Pillar, dict[Severity, int]] = defaultdict(dict)
+    for (pillar, severity), n in tallies.items():
+        counts_by_pillar[pillar][severity] = n
 
     scores: dict[str, PillarScore] = {}
     for pillar, total_checks in checks_run_per_pillar.items():
-        relevant_findings = pillar_findings.get(pillar, [])
-        scores[pillar.value] = score_pillar(pillar, relevant_findings, total_checks)
+        scores[pillar.value] = _score_from_counts(pillar, counts_by_pillar.get(pillar, {}), total_checks)
 
     return scores
 
@@ -97,7 +91,7 @@ def overall_health_score(pillar_scores: dict[str, PillarScore]) -> float:
 
     Weights are based on how critical each pillar is:
       Security × 2, Reliability × 2, Operational Excellence × 1.5,
-      Performance × 1, Cost × 1.
+      Performance × 1, Cost × 1, Sustainability × 1 (see Pillar.weight).
 
     Args:
         pillar_scores: Output of score_all_pillars().
@@ -105,31 +99,14 @@ def overall_health_score(pillar_scores: dict[str, PillarScore]) -> float:
     Returns:
         A float between 0 and 100, or 0.0 if no pillars were scored.
     """
-    pillar_weights = {
-        "Security": 2.0,
-        "Reliability": 2.0,
-        "Operational Excellence": 1.5,
-        "Performance Efficiency": 1.0,
-        "Cost Optimization": 1.0,
-        "Sustainability": 1.0,
-    }
-
-    total_weight = 0.0
-    weighted_sum = 0.0
-
-    for pillar_name, ps in pillar_scores.items():
-        # Pillars with zero checks were not scanned for this run; keep them visible
-        # in reporting but exclude them from overall score math.
-        if ps.total_checks_run == 0:
-            continue
-        weight = pillar_weights.get(pillar_name, 1.0)
-        weighted_sum += ps.score * weight
-        total_weight += weight
-
-    if total_weight == 0:
+    # Pillars with zero checks were not scanned for this run; keep them visible
+    # in reporting but exclude them from overall score math.
+    scored = [(ps.score, ps.pillar.weight) for ps in pillar_scores.values() if ps.total_checks_run]
+    if not scored:
         return 0.0
 
-    return round(weighted_sum / total_weight, 1)
+    total_weight = sum(weight for _, weight in scored)
+    return round(sum(score * weight for score, weight in scored) / total_weight, 1)
 
 
 def build_scan_result(
@@ -1,13 +1,94 @@
+import hashlib
+from functools import lru_cache
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
 
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 STATIC_DIR = Path(__file__).parent / "static"
+COMPILED_DIR = Path(__file__).parent / "_compiled_templates"
+# Written by precompile_templates: digest of the .j2 sources the modules were built from
+_COMPILED_STAMP = "SOURCE_DIGEST"
 
 
-def _load_static(filename: str) -> str:
-    """Reads a static file's content from the static directory."""
-    return (STATIC_DIR / filename).read_text(encoding="utf-8")
+def _load_static(filename: str):
+    """Reads a static file's content from the static directory as already-safe markup."""
+    from markupsafe import Markup
+
+    return Markup((STATIC_DIR / filename).read_text(encoding="utf-8"))
+
+
+def _bytecode_cache():
+    """On-disk Jinja bytecode cache shared across CLI runs, or None if unwritable."""
+    from jinja2 import FileSystemBytecodeCache
+
+    from infra_review_cli.utils.utility import cache_root
+
+    cache_dir = cache_root() / "jinja"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(str(cache_dir), "%s.cache")
+
+
+def _make_env(loader, bytecode_cache=None):
+    from jinja2 import Environment
+
+    # Templates ship with the package, so there is nothing to reload between renders.
+    env = Environment(loader=loader, autoescape=True, auto_reload=False, bytecode_cache=bytecode_cache)
+    # Static assets are read once and shared by every render as template globals
+    env.globals["inline_css"] = _load_static("report.css")
+    env.globals["inline_js"] = _load_static("report.js")
+    return env
+
+
+def _templates_digest() -> str:
+    """blake2b over every template's relative path and contents."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(TEMPLATES_DIR.rglob("*.j2")):
+        digest.update(path.relative_to(TEMPLATES_DIR).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _compiled_is_current() -> bool:
+    """True if COMPILED_DIR was built from the templates as they are now."""
+    try:
+        stamp = (COMPILED_DIR / _COMPILED_STAMP).read_text(encoding="utf-8").strip()
+    except OSError:
+        return False
+    return stamp == _templates_digest()
+
+
+@lru_cache(maxsize=1)
+def _env():
+    # Imported here so only HTML output pays for jinja2.
+    from jinja2 import ChoiceLoader, FileSystemLoader, ModuleLoader
+
+    loader = FileSystemLoader(str(TEMPLATES_DIR))
+    if _compiled_is_current():
+        # Ahead-of-time compiled templates (see precompile_templates) skip Jinja's
+        # lexer/parser/compiler. A stale build (templates edited since) is ignored.
+        loader = ChoiceLoader([ModuleLoader(str(COMPILED_DIR)), loader])
+    # Source templates are compiled once per machine rather than once per run
+    return _make_env(loader, _bytecode_cache())
+
+
+def precompile_templates(target: Path = COMPILED_DIR) -> None:
+    """
+    Compiles every report template to a Python module under `target`,
+    which _env() then loads instead of parsing the .j2 sources for as long
+    as the sources still match the digest stamped alongside them.
+    """
+    from jinja2 import FileSystemLoader
+
+    _make_env(FileSystemLoader(str(TEMPLATES_DIR))).compile_templates(str(target), zip=None)
+    (Path(target) / _COMPILED_STAMP).write_text(_templates_digest(), encoding="utf-8")
+
+
+@lru_cache(maxsize=1)
+def _template():
+    return _env().get_template("report.html.j2")
 
 
 def render_html_report(data: dict) -> str:
@@ -27,18 +108,18 @@ def render_html_report(data: dict) -> str:
     Returns:
         The rendered HTML content as a string
     """
-    env = Environment(
-        loader=FileSystemLoader(str(TEMPLATES_DIR)),
-        autoescape=True,
-    )
+    # inline_css / inline_js come from the environment globals. The dict is passed
+    # as-is rather than unpacked into keyword arguments and repacked by Jinja.
+    return _template().render(data)
 
-    template = env.get_template("report.html.j2")
 
-    # Inject static assets into the render context
-    html = template.render(
-        **data,
-        inline_css=_load_static("report.css"),
-        inline_js=_load_static("report.js"),
-    )
+def stream_html_report(data: dict, fp) -> None:
+    """
+    Renders the same report as render_html_report, writing it to the text file
+    `fp` chunk by chunk instead of building the whole HTML string in memory.
+    """
+    _template().stream(data).dump(fp)
+
 
-    return html
+if __name__ == "__main__":
+    precompile_templates()
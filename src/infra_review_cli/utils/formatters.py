@@ -1,45 +1,57 @@
 import json
+import re
+from collections import defaultdict
+from dataclasses import fields, is_dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
 from importlib.metadata import PackageNotFoundError, version
 try:
-    from markdown_it import MarkdownIt
+    import orjson
 except ImportError:
-    # Fallback to a mock/noop if markdown-it-py is not available in the environment
-    class MarkdownIt:
-        def render(self, text):
-            return text
-
-from infra_review_cli.core.models import ScanResult, Pillar
-from infra_review_cli.reports.html_report import render_html_report
+    # Fall back to the stdlib encoder if the optional C-accelerated one is missing
+    orjson = None
+from infra_review_cli.core.models import PillarScore, ScanResult, Pillar, Severity
+from infra_review_cli.reports.html_report import render_html_report, stream_html_report
 
 
 def _parse_scan_timestamp(value: str) -> datetime | None:
     if not value:
         return None
 
-    for fmt in ("%Y-%m-%d %H:%M:%S UTC", "%Y-%m-%d %H:%M:%S"):
-        try:
-            parsed = datetime.strptime(value, fmt)
-            return parsed.replace(tzinfo=timezone.utc)
-        except ValueError:
-            continue
-
+    # fromisoformat (3.11+) reads "YYYY-MM-DD HH:MM:SS" and a trailing "Z" itself,
+    # so the " UTC" suffix written by the scanner is the only thing to strip
+    cleaned = value.strip().removesuffix(" UTC")
     try:
-        cleaned = value.replace("Z", "+00:00")
         parsed = datetime.fromisoformat(cleaned)
-        if parsed.tzinfo is None:
-            return parsed.replace(tzinfo=timezone.utc)
-        return parsed.astimezone(timezone.utc)
     except ValueError:
         return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+_NON_DIGIT_RE = re.compile(r"\D")
+
+
+_REPORT_ID_STAMP = "%Y%m%d-%H%M%S"
+
+
+@lru_cache(maxsize=64)
+def _report_id_stamp(generated_at: str) -> str | None:
+    """Report-id time token for a scan timestamp, parsed once per timestamp."""
+    timestamp = _parse_scan_timestamp(generated_at)
+    return timestamp.strftime(_REPORT_ID_STAMP) if timestamp else None
 
 
 def _build_report_id(account_id: str, generated_at: str) -> str:
-    timestamp = _parse_scan_timestamp(generated_at) or datetime.now(timezone.utc)
-    account_token = "".join(ch for ch in str(account_id) if ch.isdigit()) or "UNKNOWN"
-    return f"IR-{account_token}-{timestamp.strftime('%Y%m%d-%H%M%S')}"
+    # Unparseable timestamps fall back to the current time, which is never cached
+    stamp = _report_id_stamp(generated_at) or datetime.now(timezone.utc).strftime(_REPORT_ID_STAMP)
+    account_token = _NON_DIGIT_RE.sub("", str(account_id)) or "UNKNOWN"
+    return f"IR-{account_token}-{stamp}"
 
 
+@lru_cache(maxsize=1)
 def _resolve_app_version() -> str:
     try:
         return version("infra-review-cli")
@@ -47,6 +59,17 @@ def _resolve_app_version() -> str:
         return "0.2.0"
 
 
+# Per-finding text block; str.format resolves the attribute paths itself
+_TEXT_TEMPLATE = (
+    "[{f.severity.value}] {f.headline}\n"
+    "  Resource: {f.resource_id} ({f.region})\n"
+    "  Pillar:   {f.pillar.value}\n"
+    "  Remediation: {f.remediation_steps}\n"
+)
+_TEXT_SAVINGS = "  💰 Savings: ${:,.2f}/mo\n"
+_TEXT_RULE = "-" * 40
+
+
 def format_as_text(findings) -> str:
     """Basic text output for console (fallback)."""
     if not findings:
@@ -54,21 +77,29 @@ def format_as_text(findings) -> str:
 
     output = [f"🔎 Found {len(findings)} finding(s):\n"]
     for f in findings:
-        output.append(
-            f"[{f.severity.value}] {f.headline}\n"
-            f"  Resource: {f.resource_id} ({f.region})\n"
-            f"  Pillar:   {f.pillar.value}\n"
-            f"  Remediation: {f.remediation_steps}\n"
-        )
+        output.append(_TEXT_TEMPLATE.format(f=f))
         if f.estimated_savings > 0:
-            output.append(f"  💰 Savings: ${f.estimated_savings:,.2f}/mo\n")
-        output.append("-" * 40)
+            output.append(_TEXT_SAVINGS.format(f.estimated_savings))
+        output.append(_TEXT_RULE)
     return "\n".join(output)
 
 
+@lru_cache(maxsize=None)
+def _field_names(cls) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
 def format_as_json(findings) -> str:
     """Standard JSON output."""
+    if orjson is not None:
+        # orjson encodes (slotted) dataclasses and str-Enums natively, in C
+        return orjson.dumps(findings, default=str, option=orjson.OPT_INDENT_2).decode("utf-8")
+
     def serialize(obj):
+        # Finding uses __slots__, so dataclasses have no __dict__ to fall back on.
+        # A shallow name → value dict is enough: json recurses into the values itself.
+        if is_dataclass(obj) and not isinstance(obj, type):
+            return {name: getattr(obj, name) for name in _field_names(type(obj))}
         if hasattr(obj, "__dict__"):
             return obj.__dict__
         if hasattr(obj, "value"):  # Enums
@@ -78,111 +109,136 @@ def format_as_json(findings) -> str:
     return json.dumps(findings, default=serialize, indent=2)
 
 
-def format_as_html(result: ScanResult) -> str:
-    """
-    Generates a premium, stakeholder-ready HTML report using a modular template system.
-    """
-    md = MarkdownIt()
+@lru_cache(maxsize=1)
+def _md():
+    """Shared MarkdownIt instance, imported on first HTML render rather than at CLI start."""
+    try:
+        from markdown_it import MarkdownIt
+    except ImportError:
+        # Fallback to a mock/noop if markdown-it-py is not available in the environment
+        class MarkdownIt:
+            def render(self, text):
+                return text
+    return MarkdownIt()
 
-    # 1. Prepare Pillar Data
-    pillar_colors = {
-        Pillar.SECURITY.value: "#2f9e8f",
-        Pillar.COST.value: "#14b87f",
-        Pillar.RELIABILITY.value: "#2a88c9",
-        Pillar.PERFORMANCE.value: "#2aa7a0",
-        Pillar.OPERATIONAL.value: "#d38a36",
-        Pillar.SUSTAINABILITY.value: "#7ba93e"
-    }
-    
-    # slugs for CSS variables
-    pillar_slugs = {
-        Pillar.SECURITY.value: "security",
-        Pillar.COST.value: "cost",
-        Pillar.RELIABILITY.value: "reliability",
-        Pillar.PERFORMANCE.value: "performance",
-        Pillar.OPERATIONAL.value: "operational",
-        Pillar.SUSTAINABILITY.value: "sustainability"
+
+# One-line text markdown-it would only wrap in <p>: letters, digits and punctuation
+# with no markdown or HTML meaning, no ordered-list start, no edge whitespace
+_PLAIN_TEXT_RE = re.compile(
+    r"(?!\d{1,9}[.)](?: |$))[^\W_](?:[^\W_]|[ ,.;:'\"()?/%$@=+~^{}])*(?<! )"
+)
+
+
+@lru_cache(maxsize=256)
+def _render_md(text: str) -> str:
+    """Markdown → HTML, memoised since remediation text repeats across findings."""
+    if not text:
+        return ""
+    if _PLAIN_TEXT_RE.fullmatch(text):
+        # Same output as markdown-it for plain text, without running the tokenizer
+        return "<p>" + text.replace('"', "&quot;") + "</p>\n"
+    return _md().render(text)
+
+
+# Static report lookup tables — built once at import rather than on every render.
+# Pillar → (accent color, CSS-variable slug, finding reference prefix), so each
+# finding row needs a single lookup.
+_PILLAR_META = {
+    Pillar.SECURITY.value: ("#2f9e8f", "security", "SEC"),
+    Pillar.COST.value: ("#14b87f", "cost", "COST"),
+    Pillar.RELIABILITY.value: ("#2a88c9", "reliability", "REL"),
+    Pillar.PERFORMANCE.value: ("#2aa7a0", "performance", "PERF"),
+    Pillar.OPERATIONAL.value: ("#d38a36", "operational", "OPS"),
+    Pillar.SUSTAINABILITY.value: ("#7ba93e", "sustainability", "SUS"),
+}
+_DEFAULT_PILLAR_META = ("#6366f1", "security", "GEN")
+
+# JSON embedded in <script> tags: escape markup characters as \u escapes so no
+# string value can close the tag (same scheme as Django's json_script)
+_SCRIPT_SAFE = str.maketrans({"<": "\\u003c", ">": "\\u003e", "&": "\\u0026"})
+
+
+def _script_json(value) -> str:
+    return json.dumps(value, separators=(",", ":")).translate(_SCRIPT_SAFE)
+
+
+# Pillar score → status tone, checked top-down
+_TONE_BANDS = ((75, "good"), (50, "attention"), (0, "risk"))
+_SCANNED_EXPLAINER = "Score from checks run. Starts at 100 and deducts by severity; not a resource count."
+_NOT_SCANNED_EXPLAINER = "No checks were executed for this pillar in this scan."
+
+
+def _pillar_entry(name: str, ps: PillarScore) -> dict:
+    """Template row for one pillar score."""
+    color, slug, _prefix = _PILLAR_META.get(name, _DEFAULT_PILLAR_META)
+    score = ps.score
+    scanned = ps.total_checks_run > 0
+    status_tone = (
+        next((tone for floor, tone in _TONE_BANDS if score >= floor), "risk") if scanned else "neutral"
+    )
+    return {
+        "name": name,
+        "score": int(score),
+        "status": ps.label.upper() if scanned else "NOT SCANNED",
+        "scanned": scanned,
+        "score_display": int(score) if scanned else "N/A",
+        "score_explainer": _SCANNED_EXPLAINER if scanned else _NOT_SCANNED_EXPLAINER,
+        "status_tone": status_tone,
+        "total_checks_run": ps.total_checks_run,
+        "emoji": ps.emoji,
+        "findings_count": ps.findings_count,
+        "critical_count": ps.critical_count,
+        "high_count": ps.high_count,
+        "medium_count": ps.medium_count,
+        "low_count": ps.low_count,
+        "color": color,
+        "slug": slug,
     }
 
-    pillars_list = []
-    for name, ps in result.pillar_scores.items():
-        scanned = ps.total_checks_run > 0
-        score_display = int(ps.score) if scanned else "N/A"
-        status = ps.label.upper() if scanned else "NOT SCANNED"
-        if not scanned:
-            status_tone = "neutral"
-        elif ps.score >= 75:
-            status_tone = "good"
-        elif ps.score >= 50:
-            status_tone = "attention"
-        else:
-            status_tone = "risk"
-        score_explainer = (
-            "Score from checks run. Starts at 100 and deducts by severity; not a resource count."
-            if scanned
-            else "No checks were executed for this pillar in this scan."
-        )
-        pillars_list.append({
-            "name": name,
-            "score": int(ps.score),
-            "status": status,
-            "scanned": scanned,
-            "score_display": score_display,
-            "score_explainer": score_explainer,
-            "status_tone": status_tone,
-            "total_checks_run": ps.total_checks_run,
-            "emoji": ps.emoji,
-            "findings_count": ps.findings_count,
-            "critical_count": ps.critical_count,
-            "high_count": ps.high_count,
-            "medium_count": ps.medium_count,
-            "low_count": ps.low_count,
-            "color": pillar_colors.get(name, "#6366f1"),
-            "slug": pillar_slugs.get(name, "security")
-        })
+
+def _html_report_data(result: ScanResult) -> dict:
+    """Builds the template context for the HTML report."""
+    # 1. Prepare Pillar Data
+    pillars_list = [_pillar_entry(name, ps) for name, ps in result.pillar_scores.items()]
 
     # 2. Prepare Findings Data
     findings_list = []
-    severity_order = {"Critical": 0, "High": 1, "Medium": 2, "Low": 3}
-    prefix_by_pillar = {
-        Pillar.SECURITY.value: "SEC",
-        Pillar.COST.value: "COST",
-        Pillar.RELIABILITY.value: "REL",
-        Pillar.PERFORMANCE.value: "PERF",
-        Pillar.OPERATIONAL.value: "OPS",
-        Pillar.SUSTAINABILITY.value: "SUS",
-    }
-    finding_prefix_counters: dict[str, int] = {}
+    finding_prefix_counters: defaultdict[str, int] = defaultdict(int)
+    total_savings = 0.0  # accumulated here rather than a second pass via result.total_savings
 
-    findings_sorted = sorted(
-        result.findings,
-        key=lambda finding: severity_order.get(finding.severity.value, 4),
-    )
+    # Only four severities: bucket by Severity.order instead of a comparison sort
+    # (stable within a severity, like sorted())
+    buckets: list[list] = [[] for _ in Severity]
+    for f in result.findings:
+        buckets[f.severity.order].append(f)
 
-    for f in findings_sorted:
-        prefix = prefix_by_pillar.get(f.pillar.value, "GEN")
-        finding_prefix_counters[prefix] = finding_prefix_counters.get(prefix, 0) + 1
+    for f in chain.from_iterable(buckets):
+        pillar, severity = f.pillar.value, f.severity
+        _color, slug, prefix = _PILLAR_META.get(pillar, _DEFAULT_PILLAR_META)
+        finding_prefix_counters[prefix] += 1
         finding_ref_id = f"{prefix}-{finding_prefix_counters[prefix]:03d}"
+        total_savings += f.estimated_savings
 
         findings_list.append({
             "finding_id": f.finding_id,
             "finding_ref_id": finding_ref_id,
             "resource_id": f.resource_id,
             "region": f.region,
-            "pillar": f.pillar.value,
-            "pillar_slug": pillar_slugs.get(f.pillar.value, "security"),
-            "severity": f.severity.value,
-            "severity_rank": severity_order.get(f.severity.value, 4),
+            "pillar": pillar,
+            "pillar_slug": slug,
+            "severity": severity.value,
+            "severity_rank": severity.order,
+            "severity_class": severity.lower_value,
             "title": f.headline,
-            "description": md.render(f.detailed_description or ""),
-            "remediation": md.render(f.remediation_steps or ""),
+            "description": _render_md(f.detailed_description or ""),
+            "remediation": _render_md(f.remediation_steps or ""),
             "estimated_savings": f.estimated_savings,
             "effort": f.effort.value,
             "status": "OPEN",
         })
 
-    findings_json = json.dumps(findings_list).replace("</script>", "<\\/script>")
-    pillars_json = json.dumps(pillars_list).replace("</script>", "<\\/script>")
+    findings_json = _script_json(findings_list)
+    pillars_json = _script_json(pillars_list)
 
     report_id = _build_report_id(result.account_id, result.scan_timestamp)
     duration_seconds = getattr(result, "scan_duration_seconds", None)
@@ -200,7 +256,7 @@ def format_as_html(result: ScanResult) -> str:
         "scan_duration": scan_duration,
         "app_version": _resolve_app_version(),
         "overall_score": int(result.overall_score),
-        "monthly_savings": result.total_savings,
+        "monthly_savings": total_savings,
         "ai_summary": result.executive_summary or "No summary available.",
         "pillars": pillars_list,
         "findings": findings_list,
@@ -208,5 +264,16 @@ def format_as_html(result: ScanResult) -> str:
         "findings_json": findings_json
     }
 
-    # 4. Render and return HTML string
-    return render_html_report(data)
+    return data
+
+
+def format_as_html(result: ScanResult) -> str:
+    """
+    Generates a premium, stakeholder-ready HTML report using a modular template system.
+    """
+    return render_html_report(_html_report_data(result))
+
+
+def stream_as_html(result: ScanResult, fp) -> None:
+    """Like format_as_html, but writes the report to the text file `fp` as it renders."""
+    stream_html_report(_html_report_data(result), fp)
@@ -1,27 +1,36 @@
-import boto3
 import json
+from types import MappingProxyType
+
 from infra_review_cli.config import REGION_LOCATION_MAP
 
-# Hardcoded fallback monthly prices (in USD)
-FALLBACK_PRICES = {
+# Hardcoded fallback monthly prices (in USD); read-only
+FALLBACK_PRICES = MappingProxyType({
     "ebs_gp2": 0.10,         # per GB
     "ebs_gp3": 0.08,
     "elastic_ip": 3.65,      # $0.005/hr * 730
     "elb_application": 16.42, # $0.0225/hr * 730
     "elb_network": 16.42,
     "elb_classic": 18.25,     # $0.025/hr * 730
-}
+})
+
+# Per-GB EBS fallback by storage type, so a miss needs no key formatting
+_EBS_FALLBACK = MappingProxyType({"gp2": FALLBACK_PRICES["ebs_gp2"], "gp3": FALLBACK_PRICES["ebs_gp3"]})
 
-_PRICE_CACHE = {}
+# (storage_type, region) -> price per GB
+_PRICE_CACHE: dict[tuple[str, str], float] = {}
 
 def get_ebs_price_per_gb(storage_type: str = "gp2", region: str = "us-east-1") -> float:
     """Return price per GB for EBS volume."""
-    cache_key = f"ebs-{storage_type}-{region}"
-    if cache_key in _PRICE_CACHE:
-        return _PRICE_CACHE[cache_key]
+    cache_key = (storage_type, region)
+    cached = _PRICE_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
 
     location = REGION_LOCATION_MAP.get(region, "US East (N. Virginia)")
-    pricing = boto3.client("pricing", region_name="us-east-1")
+    # deferred: only a pricing lookup should pay for importing boto3
+    from infra_review_cli.adapters.aws.session import aws_client
+
+    pricing = aws_client("pricing", region_name="us-east-1")
 
     try:
         response = pricing.get_products(
@@ -42,7 +51,10 @@ def get_ebs_price_per_gb(storage_type: str = "gp2", region: str = "us-east-1") -
         return price
 
     except Exception:
-        return FALLBACK_PRICES.get(f"ebs_{storage_type}", 0.10)
+        # Cache the fallback too, so one failed lookup isn't repeated per volume
+        price = _EBS_FALLBACK.get(storage_type, 0.10)
+        _PRICE_CACHE[cache_key] = price
+        return price
 
 
 def get_elastic_ip_price(region: str) -> float:
@@ -1,23 +1,91 @@
 import hashlib
+import os
 import re
-from datetime import datetime
+import time
+from functools import lru_cache, partial
+from pathlib import Path
 
+from infra_review_cli.config import LEGACY_FINDING_IDS
 
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+_SEP = b"-"
+_FILENAME_STAMP = "%Y%m%d_%H%M%S"
+# Characters that aren't safe in a readable, URL-friendly finding slug
+_SLUG_TRANS = str.maketrans({" ": "_", "/": "-", ".": "-"})
+
+
+# 8-byte BLAKE2b gives the 16 hex chars directly; the legacy IDs were truncated SHA-256
+_new_hasher = hashlib.sha256 if LEGACY_FINDING_IDS else partial(hashlib.blake2b, digest_size=8)
+
+
+@lru_cache(maxsize=256)
+def _check_id_prefix(check_id: str):
+    """Hash state already fed the "<check_id>-" prefix; callers must .copy() it."""
+    return _new_hasher(f"{check_id}-".encode('utf-8'))
+
+
+@lru_cache(maxsize=8192)
 def generate_finding_id(check_id: str, resource_id: str, region: str) -> str:
-    """Generates a deterministic, unique ID for a finding."""
-    # Create a unique string from the core properties
-    unique_string = f"{check_id}-{resource_id}-{region}"
+    """Generates a deterministic, unique 16-hex-char ID for a finding."""
+    # Equivalent to blake2b(f"{check_id}-{resource_id}-{region}", digest_size=8), but
+    # the check_id prefix is hashed once per check rather than once per resource.
+    h = _check_id_prefix(check_id).copy()
+    h.update(resource_id.encode('utf-8'))
+    h.update(_SEP)
+    h.update(region.encode('utf-8'))
+    return h.hexdigest()[:16]
+
+
+def clear_finding_id_cache() -> None:
+    """Empty the memoized finding IDs (and cached check-id prefixes), e.g. between tests."""
+    generate_finding_id.cache_clear()
+    _check_id_prefix.cache_clear()
+
 
-    return hashlib.sha256(unique_string.encode('utf-8')).hexdigest()[:16]
+def generate_finding_slug(check_id: str, resource_id: str, region: str) -> str:
+    """
+    Readable, URL-safe alternative to generate_finding_id, e.g. 'sec-s3-001:my-bucket:us-east-1'.
+    Unique as long as the check emits one finding per resource; no hashing involved.
+    """
+    return f"{check_id}:{resource_id}:{region}".translate(_SLUG_TRANS)
+
+
+def generate_finding_ids(triples: list[tuple[str, str, str]]) -> list[str]:
+    """generate_finding_id for many (check_id, resource_id, region) triples at once."""
+    return [generate_finding_id(*triple) for triple in triples]
+
+
+def cache_root() -> Path:
+    """
+    Root of the tool's on-disk caches: $XDG_CACHE_HOME/infra-review-cli (defaults to
+    ~/.cache/...). Each cache keeps its own subdirectory, e.g. ai/ and jinja/.
+    """
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "infra-review-cli"
 
 
 def extract_number(text: str) -> str:
     """Extracts the first number (int or float) from a string."""
-    match = re.search(r"[\d]+(?:\.\d+)?", text)
+    match = _NUMBER_RE.search(text)
     return match.group(0) if match else "0.0"
 
 
-def generate_filename(fmt: str) -> str:
-    """Generate a timestamped filename like 'infra_report_20240723.html'"""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+def extract_number_f(text: str) -> float:
+    """Like extract_number, but returns the float directly (0.0 if none found)."""
+    match = _NUMBER_RE.search(text)
+    return float(match.group(0)) if match else 0.0
+
+
+def generate_filename(fmt: str, timestamp: str | None = None) -> str:
+    """
+    Generate a timestamped filename like 'infra_report_20240723_101500.html'.
+    Pass `timestamp` to reuse one clock reading across several files.
+    """
+    timestamp = timestamp or time.strftime(_FILENAME_STAMP)
     return f"infra_report_{timestamp}.{fmt.lower()}"
+
+
+def generate_filenames(fmts: list[str]) -> list[str]:
+    """Filenames for several formats of the same report, sharing one timestamp."""
+    timestamp = time.strftime(_FILENAME_STAMP)
+    return [generate_filename(fmt, timestamp) for fmt in fmts]
@@ -0,0 +1,42 @@
+# tests/core/ai/test_cost.py
+
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from infra_review_cli.core.ai.cost import estimate_savings_bulk
+
+
+def _reply(prompt, *args):
+    # One distinct figure per region so results can be traced back to their input
+    return "$42.50" if "us-east-1" in prompt else "$7"
+
+
+class TestEstimateSavingsBulk(unittest.TestCase):
+
+    @patch("infra_review_cli.core.ai.cost.call_ai", side_effect=_reply)
+    def test_duplicate_keys_share_one_call_and_order_is_kept(self, mock_call):
+        items = [
+            ("elb", "unused_elb", "us-east-1"),
+            ("elb", "unused_elb", "eu-west-1"),
+            ("elb", "unused_elb", "us-east-1"),
+        ]
+
+        self.assertEqual(estimate_savings_bulk(items), [42.5, 7.0, 42.5])
+        self.assertEqual(mock_call.call_count, 2)
+
+    @patch("infra_review_cli.core.ai.cost.call_ai", return_value=None)
+    def test_falls_back_without_ai(self, _):
+        self.assertEqual(estimate_savings_bulk([("elb", "unused_elb", "us-east-1")]), [10.0])
+        self.assertEqual(estimate_savings_bulk([]), [])
+
+    @patch("infra_review_cli.core.ai.cost.call_ai", side_effect=_reply)
+    def test_works_inside_a_running_event_loop(self, _):
+        async def caller():
+            return estimate_savings_bulk([("elb", "unused_elb", "eu-west-1")])
+
+        self.assertEqual(asyncio.run(caller()), [7.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
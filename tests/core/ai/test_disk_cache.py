@@ -0,0 +1,81 @@
+# tests/core/ai/test_disk_cache.py
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from infra_review_cli.core.ai import disk_cache
+
+
+class TestDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._env = patch.dict(os.environ, {"XDG_CACHE_HOME": self._tmp.name})
+        self._env.start()
+        disk_cache._conn = None
+
+    def tearDown(self):
+        if disk_cache._conn is not None:
+            disk_cache._conn.close()
+            disk_cache._conn = None
+        self._env.stop()
+        self._tmp.cleanup()
+
+    def test_second_lookup_is_served_from_disk(self):
+        compute = MagicMock(return_value="- Enable MFA")
+        key = disk_cache.make_key("model", "prompt")
+
+        self.assertEqual(disk_cache.get_or_compute(key, compute), "- Enable MFA")
+        self.assertEqual(disk_cache.get_or_compute(key, compute), "- Enable MFA")
+        compute.assert_called_once()
+        self.assertTrue((disk_cache.cache_dir() / "responses.sqlite3").exists())
+
+    def test_none_and_expired_values_are_recomputed(self):
+        key = disk_cache.make_key("model", "prompt")
+        none_compute = MagicMock(return_value=None)
+        disk_cache.get_or_compute(key, none_compute)
+        disk_cache.get_or_compute(key, none_compute)
+        self.assertEqual(none_compute.call_count, 2)
+
+        compute = MagicMock(return_value="x")
+        disk_cache.get_or_compute(key, compute, ttl_s=0)
+        disk_cache.get_or_compute(key, compute, ttl_s=0)
+        self.assertEqual(compute.call_count, 2)
+
+    def test_row_older_than_ttl_is_recomputed_and_replaced(self):
+        key = disk_cache.make_key("model", "prompt")
+        disk_cache.get_or_compute(key, MagicMock(return_value="old"), ttl_s=60)
+
+        # Eleven minutes later the 60s entry has expired
+        with patch.object(disk_cache.time, "time", return_value=disk_cache.time.time() + 660):
+            fresh = MagicMock(return_value="new")
+            self.assertEqual(disk_cache.get_or_compute(key, fresh, ttl_s=60), "new")
+            fresh.assert_called_once()
+
+            cached = MagicMock(return_value="unused")
+            self.assertEqual(disk_cache.get_or_compute(key, cached, ttl_s=60), "new")
+            cached.assert_not_called()
+
+    def test_rejected_values_are_returned_but_not_cached(self):
+        key = disk_cache.make_key("model", "prompt")
+        compute = MagicMock(return_value="not json")
+        is_object = lambda value: value.startswith("{")
+
+        for _ in range(2):
+            self.assertEqual(disk_cache.get_or_compute(key, compute, validate=is_object), "not json")
+        self.assertEqual(compute.call_count, 2)
+
+    def test_writes_purge_expired_rows(self):
+        disk_cache.get_or_compute(disk_cache.make_key("stale"), MagicMock(return_value="old"), ttl_s=60)
+
+        with patch.object(disk_cache.time, "time", return_value=disk_cache.time.time() + 660):
+            disk_cache.get_or_compute(disk_cache.make_key("fresh"), MagicMock(return_value="new"), ttl_s=60)
+
+        rows = disk_cache._conn.execute("SELECT value FROM responses").fetchall()
+        self.assertEqual(rows, [("new",)])
+
+
+if __name__ == "__main__":
+    unittest.main()
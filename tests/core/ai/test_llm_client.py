@@ -0,0 +1,34 @@
+# tests/core/ai/test_llm_client.py
+
+import threading
+import unittest
+from unittest.mock import patch
+
+from infra_review_cli.core.ai import llm_client
+
+
+class TestAIExecutor(unittest.TestCase):
+
+    def test_concurrent_first_calls_share_one_pool(self):
+        pools = []
+        start = threading.Barrier(8)
+
+        def grab():
+            start.wait()
+            pools.append(llm_client.ai_executor())
+
+        with patch.object(llm_client, "_executor", None):
+            threads = [threading.Thread(target=grab) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            created = llm_client._executor
+
+        self.assertEqual(len(pools), 8)
+        self.assertTrue(all(pool is created for pool in pools))
+        created.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+# tests/core/ai/test_remediation.py
+
+import asyncio
+import json
+import threading
+import unittest
+from unittest.mock import patch
+
+from infra_review_cli.core.ai.remediation import (
+    _dedupe,
+    generate_ai_remediations,
+    generate_ai_report,
+    resolve_remediations,
+)
+from infra_review_cli.core.models import Finding, Pillar, Severity
+
+
+def _finding(finding_id):
+    return Finding(
+        finding_id=finding_id,
+        resource_id=f"res-{finding_id}",
+        region="us-east-1",
+        pillar=Pillar.SECURITY,
+        severity=Severity.HIGH,
+        headline=f"Issue {finding_id}",
+        detailed_description="Something is wrong.",
+    )
+
+
+class TestGenerateAIRemediations(unittest.TestCase):
+
+    @patch("infra_review_cli.core.ai.remediation.call_ai")
+    def test_parses_json_reply_into_bullets(self, mock_call):
+        mock_call.return_value = json.dumps({"remediations": [
+            {"id": "a", "steps": ["Enable MFA", "Rotate keys", "Extra step"]},
+            {"id": "b", "steps": ["Delete the volume"]},
+        ]})
+
+        result = generate_ai_remediations([_finding("a"), _finding("b")])
+
+        self.assertEqual(result["a"], "- Enable MFA\n- Rotate keys")
+        self.assertEqual(result["b"], "- Delete the volume")
+        self.assertIsNotNone(mock_call.call_args.args[1])
+
+    @patch("infra_review_cli.core.ai.remediation.call_ai")
+    def test_batches_and_tolerates_bad_replies(self, mock_call):
+        # Batches run concurrently, so reply by content rather than call order
+        mock_call.side_effect = lambda prompt, *args: (
+            "```json\n[{\"id\": \"f0\", \"steps\": [\"Fix it\"]}]\n```"
+            if '"id": "f0"' in prompt else "not json"
+        )
+
+        result = generate_ai_remediations([_finding(f"f{i}") for i in range(12)])
+
+        self.assertEqual(mock_call.call_count, 2)
+        self.assertEqual(result, {"f0": "- Fix it"})
+
+    @patch("infra_review_cli.core.ai.remediation.call_ai", return_value=None)
+    def test_returns_empty_without_ai(self, _):
+        self.assertEqual(generate_ai_remediations([_finding("a")]), {})
+
+    @patch("infra_review_cli.core.ai.remediation.call_ai")
+    def test_resolve_remediations_fills_only_empty_steps(self, mock_call):
+        mock_call.return_value = json.dumps({"remediations": [
+            {"id": "a", "steps": ["Enable MFA"]},
+            {"id": "b", "steps": ["Ignored"]},
+        ]})
+        pending, done = _finding("a"), _finding("b")
+        done.remediation_steps = "- Keep me"
+
+        resolve_remediations([pending, done])
+
+        self.assertEqual(pending.remediation_steps, "- Enable MFA")
+        self.assertEqual(done.remediation_steps, "- Keep me")
+        mock_call.assert_called_once()
+
+    @patch("infra_review_cli.core.ai.remediation.call_ai")
+    def test_resolve_remediations_fills_many_findings_through_the_pool(self, mock_call):
+        findings = [_finding(f"f{n}") for n in range(12)]
+        threads = []
+
+        def reply(prompt, *args):
+            threads.append(threading.current_thread().name)
+            return json.dumps({"remediations": [
+                {"id": f.finding_id, "steps": [f"Fix {f.finding_id}"]}
+                for f in findings if f'"id": "{f.finding_id}"' in prompt
+            ]})
+
+        mock_call.side_effect = reply
+
+        resolve_remediations(findings)
+
+        # Two batches (10 + 2), each sent from an AI pool worker thread
+        self.assertEqual(mock_call.call_count, 2)
+        self.assertTrue(all(name.startswith("ai") for name in threads))
+        self.assertEqual([f.remediation_steps for f in findings], [f"- Fix f{n}" for n in range(12)])
+
+    @patch("infra_review_cli.core.ai.remediation.call_ai")
+    def test_same_issue_on_many_resources_is_sent_once(self, mock_call):
+        mock_call.return_value = json.dumps({"remediations": [
+            {"id": "a", "steps": ["Block public access on {resource}"]},
+        ]})
+        findings = [
+            Finding(
+                finding_id=name, resource_id=f"bucket-{name}", region="us-east-1",
+                pillar=Pillar.SECURITY, severity=Severity.HIGH,
+                headline=f"S3 bucket 'bucket-{name}' is publicly accessible",
+                detailed_description="Bucket policy allows public reads.",
+            )
+            for name in ("a", "b")
+        ]
+
+        result = generate_ai_remediations(findings)
+
+        prompt = mock_call.call_args.args[0]
+        self.assertIn("S3 bucket '{resource}' is publicly accessible", prompt)
+        self.assertNotIn("bucket-b", prompt)
+        self.assertEqual(result, {
+            "a": "- Block public access on bucket-a",
+            "b": "- Block public access on bucket-b",
+        })
+
+    @patch("infra_review_cli.core.ai.remediation.call_ai")
+    def test_shared_steps_only_fill_the_placeholder(self, mock_call):
+        # "web" is a substring of "webapp-prod"; only {resource} may be rewritten
+        mock_call.return_value = json.dumps({"remediations": [
+            {"id": "web", "steps": ["Run aws ecs update-service --service {resource} --task-definition webapp-prod:5"]},
+        ]})
+        findings = [
+            Finding(
+                finding_id=name, resource_id=name, region="us-east-1",
+                pillar=Pillar.PERFORMANCE, severity=Severity.MEDIUM,
+                headline=f"ECS service '{name}' is not using latest task definition",
+                detailed_description="The service is using revision 3, but the latest available is 5.",
+            )
+            for name in ("web", "api")
+        ]
+
+        resolve_remediations(findings)
+
+        mock_call.assert_called_once()
+        self.assertEqual(
+            findings[1].remediation_steps,
+            "- Run aws ecs update-service --service api --task-definition webapp-prod:5",
+        )
+
+    def test_unquoted_short_ids_do_not_merge_different_issues(self):
+        findings = [
+            Finding(
+                finding_id=rid, resource_id=rid, region="us-east-1",
+                pillar=Pillar.SECURITY, severity=Severity.HIGH,
+                headline=f"Issue on {rid}", detailed_description=f"The {rid} server on {rid} is exposed.",
+            )
+            for rid in ("db", "web")
+        ]
+
+        representatives, _groups = _dedupe(findings)
+
+        self.assertEqual(len(representatives), 2)
+
+
+class TestGenerateAIReport(unittest.TestCase):
+
+    @patch("infra_review_cli.core.ai.remediation.call_ai")
+    def test_single_call_returns_summary_and_remediations(self, mock_call):
+        mock_call.return_value = json.dumps({
+            "summary": "All good.",
+            "remediations": [{"id": "a", "steps": ["Enable MFA"]}],
+        })
+        done = _finding("b")
+        done.remediation_steps = "- Already set"
+
+        report = generate_ai_report([_finding("a"), done], {}, 80.0, "123", "us-east-1")
+
+        self.assertEqual(mock_call.call_count, 1)
+        self.assertEqual(report["summary"], "All good.")
+        self.assertEqual(report["remediations"], {"a": "- Enable MFA"})
+        self.assertNotIn('"id": "b"', mock_call.call_args.args[0])
+
+    @patch("infra_review_cli.core.ai.remediation.call_ai", return_value=None)
+    def test_falls_back_without_ai(self, _):
+        report = generate_ai_report([_finding("a")], {}, 80.0, "123", "us-east-1")
+
+        self.assertIn("1 finding(s)", report["summary"])
+        self.assertEqual(report["remediations"], {})
+
+    @patch("infra_review_cli.core.ai.remediation.call_ai")
+    def test_works_inside_a_running_event_loop(self, mock_call):
+        mock_call.return_value = json.dumps({
+            "summary": "All good.",
+            "remediations": [{"id": "a", "steps": ["Enable MFA"]}],
+        })
+
+        async def caller():
+            return generate_ai_report([_finding("a")], {}, 80.0, "123", "us-east-1")
+
+        report = asyncio.run(caller())
+
+        self.assertEqual(report["summary"], "All good.")
+        self.assertEqual(report["remediations"], {"a": "- Enable MFA"})
+
+
+if __name__ == "__main__":
+    unittest.main()
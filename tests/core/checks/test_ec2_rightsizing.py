@@ -48,5 +48,36 @@ class TestEC2Rightsizing(unittest.TestCase):
         self.assertEqual(finding.resource_id, "i-low-1")
         self.assertEqual(finding.estimated_savings, 15.0)
 
+    @patch("infra_review_cli.core.checks.ec2.suggest_ec2_rightsizing")
+    def test_overutilized_instances_keep_input_order(self, mock_suggest):
+        mock_suggest.return_value = None
+        base = {"instance_type": "m5.large", "region": "us-east-1", "current_price": 0.096}
+        instance_data = [
+            {**base, "instance_id": "i-hot", "cpu_avg": 92.0, "cpu_max": 99.0},
+            {**base, "instance_id": "i-ok", "cpu_avg": 45.0, "cpu_max": 80.0},
+            {**base, "instance_id": "i-spiky", "cpu_avg": 65.0, "cpu_max": 95.0},
+        ]
+
+        findings = check_ec2_rightsizing(instance_data, threshold=20.0)
+
+        self.assertEqual([f.resource_id for f in findings], ["i-hot", "i-spiky"])
+        mock_suggest.assert_not_called()
+
+    @patch("infra_review_cli.core.checks.ec2.suggest_ec2_rightsizing")
+    def test_concurrent_suggestions_keep_input_order(self, mock_suggest):
+        mock_suggest.side_effect = lambda **kw: {
+            "suggested_instance_type": "t4g.nano",
+            "reasoning": f"Idle {kw['instance_id']}.",
+            "estimated_monthly_savings": 1.0,
+        }
+        base = {"instance_type": "t3.small", "region": "us-east-1", "current_price": 0.02, "cpu_max": 10.0}
+        instance_data = [{**base, "instance_id": f"i-{n}", "cpu_avg": 3.0} for n in range(5)]
+
+        findings = check_ec2_rightsizing(instance_data, threshold=20.0)
+
+        self.assertEqual([f.resource_id for f in findings], [f"i-{n}" for n in range(5)])
+        self.assertIn("Idle i-3.", findings[3].detailed_description)
+        self.assertEqual(mock_suggest.call_count, 5)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,55 @@
+# tests/core/checks/test_ecs.py
+
+import json
+import unittest
+from unittest.mock import patch
+
+from infra_review_cli.core.base_provider import BaseCloudProvider
+from infra_review_cli.core.checks.ecs import (
+    _DRIFT_FALLBACK_STEPS,
+    check_ecs_task_definition_drift,
+    check_ecs_task_definition_drift_deferred,
+)
+from infra_review_cli.core.models import ScanResult
+
+
+class TestTaskDefinitionDrift(unittest.TestCase):
+
+    def test_deferred_variant_leaves_steps_for_the_caller(self):
+        findings = check_ecs_task_definition_drift_deferred("web", "3", "5", "us-east-1")
+
+        self.assertEqual(len(findings), 1)
+        self.assertEqual(findings[0].remediation_steps, "")
+        self.assertEqual(findings[0].fallback_remediation, _DRIFT_FALLBACK_STEPS)
+
+    @patch("infra_review_cli.core.ai.remediation.call_ai")
+    def test_steps_are_resolved_through_ai(self, mock_call):
+        finding_id = check_ecs_task_definition_drift_deferred("web", "3", "5", "us-east-1")[0].finding_id
+        mock_call.return_value = json.dumps({"remediations": [
+            {"id": finding_id, "steps": ["Redeploy with revision 5"]},
+        ]})
+
+        findings = check_ecs_task_definition_drift("web", "3", "5", "us-east-1")
+
+        self.assertEqual(findings[0].remediation_steps, "- Redeploy with revision 5")
+
+    @patch("infra_review_cli.core.ai.remediation.call_ai", return_value=None)
+    def test_falls_back_to_static_steps_without_ai(self, _):
+        findings = check_ecs_task_definition_drift("web", "3", "5", "us-east-1")
+
+        self.assertEqual(findings[0].remediation_steps, _DRIFT_FALLBACK_STEPS)
+
+    @patch("infra_review_cli.core.ai.remediation.call_ai", return_value=None)
+    def test_finalize_scan_falls_back_to_the_drift_steps(self, _):
+        class Provider(BaseCloudProvider):
+            validate_credentials = get_account_id = get_checks = run_scan = None
+
+        result = ScanResult(findings=check_ecs_task_definition_drift_deferred("web", "3", "5", "us-east-1"))
+
+        Provider().finalize_scan(result)
+
+        self.assertEqual(result.findings[0].remediation_steps, _DRIFT_FALLBACK_STEPS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+# tests/core/checks/test_performance.py
+
+import time
+import unittest
+
+from infra_review_cli.core.checks.performance import check_cloudfront_usage
+
+
+class TestCloudFrontUsage(unittest.TestCase):
+
+    def test_origins_are_matched_exactly_after_normalisation(self):
+        distributions = [{"Origins": {"Items": [
+            {"DomainName": "My.Site.s3.us-east-1.amazonaws.com"},
+            {"DomainName": "https://app-123.us-east-1.elb.amazonaws.com/"},
+            {"DomainName": "dualstack.api-9.eu-west-1.elb.amazonaws.com."},
+        ]}}]
+
+        findings = check_cloudfront_usage(
+            distributions,
+            public_buckets=["my.site", "site"],
+            alb_dns_names=[
+                "APP-123.us-east-1.elb.amazonaws.com",
+                "api-9.eu-west-1.elb.amazonaws.com",
+                "app-1.us-east-1.elb.amazonaws.com",
+            ],
+            region="us-east-1",
+        )
+
+        self.assertEqual(
+            [f.resource_id for f in findings],
+            ["site", "app-1.us-east-1.elb.amazonaws.com"],
+        )
+
+    def test_bucket_names_containing_s3_labels_are_matched_whole(self):
+        distributions = [{"Origins": {"Items": [
+            {"DomainName": "logs.s3-archive.s3.amazonaws.com"},
+            {"DomainName": "media.s3.assets.s3-website-us-east-1.amazonaws.com"},
+            {"DomainName": "cn-bucket.s3.cn-north-1.amazonaws.com.cn"},
+        ]}}]
+
+        findings = check_cloudfront_usage(
+            distributions,
+            public_buckets=["logs.s3-archive", "media.s3.assets", "cn-bucket", "logs"],
+            alb_dns_names=[],
+            region="us-east-1",
+        )
+
+        self.assertEqual([f.resource_id for f in findings], ["logs"])
+
+    def test_long_hyphenated_non_s3_origin_is_rejected_quickly(self):
+        distributions = [{"Origins": {"Items": [
+            {"DomainName": "x.s3" + "-a" * 40 + ".example.org"},
+        ]}}]
+
+        started = time.perf_counter()
+        findings = check_cloudfront_usage(
+            distributions, public_buckets=["x"], alb_dns_names=[], region="us-east-1",
+        )
+
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertEqual([f.resource_id for f in findings], ["x"])
+
+
+if __name__ == "__main__":
+    unittest.main()
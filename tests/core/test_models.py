@@ -0,0 +1,36 @@
+# tests/core/test_models.py
+
+import unittest
+
+from infra_review_cli.core.models import Finding, Pillar, ScanResult, Severity
+
+
+def _finding(finding_id, pillar=Pillar.COST, savings=0.0):
+    return Finding(
+        finding_id=finding_id,
+        resource_id=f"res-{finding_id}",
+        region="us-east-1",
+        pillar=pillar,
+        severity=Severity.LOW,
+        headline=f"Issue {finding_id}",
+        estimated_savings=savings,
+    )
+
+
+class TestScanResultViews(unittest.TestCase):
+
+    def test_views_follow_in_place_changes_to_findings(self):
+        result = ScanResult(findings=[_finding("a", savings=5.0)])
+        self.assertEqual(result.total_savings, 5.0)
+        self.assertEqual(list(result.findings_by_pillar), ["Cost Optimization"])
+
+        result.findings.append(_finding("b", pillar=Pillar.SECURITY, savings=2.0))
+        result.findings[0].estimated_savings = 10.0
+
+        self.assertEqual(result.total_savings, 12.0)
+        self.assertEqual(list(result.findings_by_pillar), ["Cost Optimization", "Security"])
+        self.assertEqual(len(result.findings_by_severity["Low"]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,8 +8,8 @@ if 'dotenv' not in sys.modules:
     dotenv_stub.load_dotenv = lambda *args, **kwargs: None
     sys.modules['dotenv'] = dotenv_stub
 
-from infra_review_cli.core.models import Pillar, PillarScore
-from infra_review_cli.core.scoring import overall_health_score
+from infra_review_cli.core.models import Finding, Pillar, PillarScore, Severity
+from infra_review_cli.core.scoring import overall_health_score, score_all_pillars, score_pillar
 
 
 class TestOverallHealthScore(unittest.TestCase):
@@ -43,5 +43,46 @@ class TestOverallHealthScore(unittest.TestCase):
         self.assertEqual(overall_health_score(pillar_scores), 55.0)
 
 
+class TestScorePillar(unittest.TestCase):
+    @staticmethod
+    def make_finding(severity: Severity) -> Finding:
+        return Finding(
+            finding_id=severity.value,
+            resource_id="res",
+            region="us-east-1",
+            pillar=Pillar.SECURITY,
+            severity=severity,
+            headline="Issue",
+            detailed_description="Something is wrong.",
+        )
+
+    def test_deducts_by_severity_and_tallies_counts(self):
+        findings = [self.make_finding(s) for s in (Severity.CRITICAL, Severity.HIGH, Severity.HIGH, Severity.LOW)]
+
+        ps = score_pillar(Pillar.SECURITY, findings, total_checks_run=3)
+
+        # 100 - 25 - 15 - 15 - 3
+        self.assertEqual(ps.score, 42.0)
+        self.assertEqual(
+            (ps.critical_count, ps.high_count, ps.medium_count, ps.low_count),
+            (1, 2, 0, 1),
+        )
+        self.assertEqual(ps.findings_count, 4)
+
+    def test_score_is_clamped_at_zero(self):
+        findings = [self.make_finding(Severity.CRITICAL)] * 5
+
+        self.assertEqual(score_pillar(Pillar.SECURITY, findings, 1).score, 0.0)
+
+    def test_score_all_pillars_matches_per_pillar_scoring(self):
+        findings = [self.make_finding(s) for s in (Severity.HIGH, Severity.MEDIUM)]
+
+        scores = score_all_pillars(findings, {Pillar.SECURITY: 2, Pillar.COST: 1})
+
+        self.assertEqual(scores[Pillar.SECURITY.value], score_pillar(Pillar.SECURITY, findings, 2))
+        self.assertEqual(scores[Pillar.COST.value].score, 100.0)
+        self.assertEqual(scores[Pillar.COST.value].findings_count, 0)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,27 @@
+# tests/reports/test_html_report.py
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from infra_review_cli.reports import html_report
+
+
+class TestPrecompiledTemplates(unittest.TestCase):
+
+    def test_compiled_templates_are_used_only_while_sources_match(self):
+        with tempfile.TemporaryDirectory() as tmp, patch.object(html_report, "COMPILED_DIR", Path(tmp)):
+            self.assertFalse(html_report._compiled_is_current())
+
+            # What precompile_templates stamps next to the compiled modules
+            (Path(tmp) / html_report._COMPILED_STAMP).write_text(html_report._templates_digest())
+            self.assertTrue(html_report._compiled_is_current())
+
+            # A template edited after precompiling makes the build stale
+            with patch.object(html_report, "_templates_digest", return_value="edited"):
+                self.assertFalse(html_report._compiled_is_current())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import json
 import unittest
 from unittest.mock import patch
 import sys
@@ -84,5 +85,35 @@ class TestHtmlFormatterPillarMetadata(unittest.TestCase):
         self.assertEqual(sustainability['status_tone'], 'neutral')
 
 
+class TestScriptJson(unittest.TestCase):
+    def test_markup_characters_cannot_close_the_script_tag(self):
+        payload = {'title': '</script><img src=x onerror=alert(1)>&'}
+
+        encoded = formatters._script_json(payload)
+
+        self.assertNotIn('<', encoded)
+        self.assertNotIn('>', encoded)
+        self.assertNotIn('&', encoded)
+        self.assertEqual(json.loads(encoded), payload)
+
+
+class TestRenderMarkdown(unittest.TestCase):
+    def test_plain_text_fast_path_matches_markdown_it(self):
+        samples = [
+            '',
+            'Enable MFA for the root user.',
+            'Set "user": 1000 in the container definition',
+            'Migrate from m5.large to m6g.large',
+            '1. Numbered step',
+            '- Bullet step',
+            'Use **bold** and `code`',
+            'a & b < c',
+            'trailing space ',
+        ]
+        for text in samples:
+            with self.subTest(text=text):
+                self.assertEqual(formatters._render_md.__wrapped__(text), formatters._md().render(text))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,78 @@
+import hashlib
+import unittest
+from unittest.mock import patch
+
+from infra_review_cli.utils import utility
+from infra_review_cli.utils.utility import (
+    clear_finding_id_cache,
+    extract_number,
+    extract_number_f,
+    generate_finding_id,
+    generate_finding_ids,
+    generate_finding_slug,
+)
+
+
+class TestGenerateFindingId(unittest.TestCase):
+    def setUp(self):
+        clear_finding_id_cache()
+
+    def test_id_is_pinned_blake2b_of_the_joined_key(self):
+        finding_id = generate_finding_id("sec-s3-001", "my-bucket", "us-east-1")
+
+        # Pinned so a hashing change (or a machine-dependent one) can't slip in unnoticed
+        self.assertEqual(finding_id, "5bffe16fdf4b98d2")
+        self.assertEqual(
+            finding_id,
+            hashlib.blake2b(b"sec-s3-001-my-bucket-us-east-1", digest_size=8).hexdigest(),
+        )
+
+    def test_legacy_ids_are_truncated_sha256(self):
+        with patch.object(utility, "_new_hasher", hashlib.sha256):
+            clear_finding_id_cache()
+            finding_id = generate_finding_id("sec-s3-001", "my-bucket", "us-east-1")
+        clear_finding_id_cache()
+
+        self.assertEqual(
+            finding_id,
+            hashlib.sha256(b"sec-s3-001-my-bucket-us-east-1").hexdigest()[:16],
+        )
+
+    def test_ids_differ_per_resource(self):
+        self.assertNotEqual(
+            generate_finding_id("sec-s3-001", "bucket-a", "us-east-1"),
+            generate_finding_id("sec-s3-001", "bucket-b", "us-east-1"),
+        )
+
+    def test_bulk_ids_match_single_ids(self):
+        triples = [("sec-s3-001", "my-bucket", "us-east-1"), ("cost-ec2-001", "i-123", "eu-west-1")]
+
+        self.assertEqual(generate_finding_ids(triples), [generate_finding_id(*t) for t in triples])
+
+    def test_repeat_calls_are_memoized(self):
+        generate_finding_id("sec-s3-001", "my-bucket", "us-east-1")
+        generate_finding_id("sec-s3-001", "my-bucket", "us-east-1")
+
+        self.assertEqual(generate_finding_id.cache_info().hits, 1)
+
+
+class TestGenerateFindingSlug(unittest.TestCase):
+    def test_slug_keeps_fields_readable_and_url_safe(self):
+        self.assertEqual(
+            generate_finding_slug("sec-vpc-001", "sg-1/0.0.0.0 any", "us-east-1"),
+            "sec-vpc-001:sg-1-0-0-0-0_any:us-east-1",
+        )
+
+
+class TestExtractNumber(unittest.TestCase):
+    def test_extracts_first_number(self):
+        self.assertEqual(extract_number("About $42.50 per month"), "42.50")
+        self.assertEqual(extract_number_f("About $42.50 per month"), 42.5)
+
+    def test_defaults_when_no_number(self):
+        self.assertEqual(extract_number("n/a"), "0.0")
+        self.assertEqual(extract_number_f("n/a"), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()